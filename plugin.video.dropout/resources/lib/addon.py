@@ -1,45 +1,85 @@
+import functools
 import sys
 
 import xbmcaddon
-import xbmcvfs
 
 from .config import Config
 from .settings import Settings
 
 _ID = "plugin.video.dropout"
-_XBMC = xbmcaddon.Addon(_ID)
 
 
 class Addon:
     ID = _ID
-    XBMC = _XBMC
-    PATH = _XBMC.getAddonInfo("path")
-    CONFIG = Config(xbmcvfs.translatePath(f"special://profile/addon_data/{_ID}"))
     PLAYER_VIDEO_ID = f"{_ID}.video_id"
 
+    # set once per plugin invocation, reset it when simulating several invocations in one process
+    _HANDLE: int | None = None
+    _XBMC: xbmcaddon.Addon | None = None
+    _SETTINGS: xbmcaddon.Settings | None = None
+    _DEBUG: bool | None = None
+    _CREDENTIALS: tuple[str, str] | None = None
+
+    @classmethod
+    def xbmc(cls) -> xbmcaddon.Addon:
+        if cls._XBMC is None:
+            cls._XBMC = xbmcaddon.Addon(cls.ID)
+        return cls._XBMC
+
+    @classmethod
+    @functools.cache
+    def path(cls) -> str:
+        return cls.xbmc().getAddonInfo("path")
+
     @classmethod
     def handle(cls) -> int:
-        return int(sys.argv[1])
+        if cls._HANDLE is None:
+            cls._HANDLE = int(sys.argv[1])
+        return cls._HANDLE
+
+    @classmethod
+    @functools.cache
+    def config(cls) -> Config:
+        import xbmcvfs  # noqa: PLC0415
+
+        return Config(xbmcvfs.translatePath(f"special://profile/addon_data/{cls.ID}"))
 
     @classmethod
     def debug(cls) -> bool:
-        return cls.XBMC.getSettings().getBool("debug_mode")
+        if cls._DEBUG is None:
+            cls._DEBUG = cls.__settings().getBool("debug_mode")
+        return cls._DEBUG
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._XBMC = None
+        cls._SETTINGS = None
+        cls._DEBUG = None
+        cls._CREDENTIALS = None
+        cls.settings.cache_clear()
+
+    @classmethod
+    def __settings(cls) -> xbmcaddon.Settings:
+        if cls._SETTINGS is None:
+            cls._SETTINGS = cls.xbmc().getSettings()
+        return cls._SETTINGS
 
     @classmethod
     def credentials(cls) -> tuple[str, str]:
-        return (
-            cls.XBMC.getSettings().getString("username"),
-            cls.XBMC.getSettings().getString("password"),
-        )
+        if cls._CREDENTIALS is None:
+            settings = cls.__settings()
+            cls._CREDENTIALS = (settings.getString("username"), settings.getString("password"))
+        return cls._CREDENTIALS
 
     @classmethod
     def reset_credentials(cls) -> None:
-        cls.XBMC.setSetting("username", "")
-        cls.XBMC.setSetting("password", "")
+        cls.xbmc().setSetting("username", "")
+        cls.xbmc().setSetting("password", "")
+        cls._CREDENTIALS = ("", "")
 
     @classmethod
     def use_inputstream_adaptive(cls) -> bool:
-        return cls.XBMC.getSettings().getBool("use_inputstream_adaptive") and cls.is_inputstream_adaptive_available()
+        return cls.__settings().getBool("use_inputstream_adaptive") and cls.is_inputstream_adaptive_available()
 
     @classmethod
     def is_inputstream_adaptive_available(cls) -> bool:
@@ -50,5 +90,6 @@ class Addon:
         return addon is not None
 
     @classmethod
+    @functools.cache
     def settings(cls) -> Settings:
         return Settings()
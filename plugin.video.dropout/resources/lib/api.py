@@ -1,30 +1,67 @@
 import datetime
 import hashlib
 import html
+import importlib.util
+import itertools
 import json
+import math
 import re
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from http import HTTPStatus
 from typing import Any, ClassVar
 from urllib.parse import urlencode
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 from .addon import Addon
 from .config import Credentials, PlayState
-from .utils import LOGDEBUG, LOGERROR, LOGNONE, LOGWARNING, log_message
+from .utils import LOGDEBUG, LOGERROR, LOGNONE, LOGWARNING, log_exception, log_message
 
-REQUEST_TIMEOUT_S = (10, 30)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ciso8601
 
-TOKEN_FINDER = r'(?s)window\.VHX\.config\s*=\s*{.*token:\s*"([^"]*)",'  # noqa: S105
-USER_FINDER = r'_current_user":{"id":([^,]+),"'
-EMBED_FINDER = r'(?s)window\.VHX\.config\s*=\s*{.*embed_url:\s*"([^"]*)",'
-CONFIG_FINDER = r"(?s)window\.OTTData\s*=\s*({.*})\s*</script>"
-EMBED_ID_FINDER = r"https://embed\.vhx\.tv/videos/(\d+)\?"
-COLLECTION_ID_FINDER = r"https://api\.vhx\.tv/collections/(\d+)/items"
+    _parse_datetime = ciso8601.parse_datetime
+except ImportError:
+    _parse_datetime = datetime.datetime.fromisoformat
 
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
 
-@dataclass
+REQUEST_TIMEOUT_S = (10, 30)
+REQUEST_POOL_CONNECTIONS = 4
+REQUEST_POOL_MAXSIZE = 8
+REQUEST_MAX_WORKERS = 4
+PLAY_STATE_BATCH_SIZE = 50
+CSRF_TOKEN_TTL = datetime.timedelta(minutes=10)
+
+TOKEN_FINDER = re.compile(r'(?s)window\.VHX\.config\s*=\s*{.*token:\s*"([^"]*)",')
+USER_FINDER = re.compile(r'_current_user":{"id":([^,]+),"')
+# group 2 captures the video id when the URL prefix isn't entity-escaped in the page
+EMBED_FINDER = re.compile(
+    r'(?s)window\.VHX\.config\s*=\s*{.*embed_url:\s*"((?:https://embed\.vhx\.tv/videos/(\d+)\?)?[^"]*)",'
+)
+CONFIG_FINDER = re.compile(r"(?s)window\.OTTData\s*=\s*({.*})\s*</script>")
+EMBED_ID_FINDER = re.compile(r"https://embed\.vhx\.tv/videos/(\d+)\?")
+COLLECTION_ID_FINDER = re.compile(r"https://api\.vhx\.tv/collections/(\d+)/items")
+CSRF_META_FINDER = re.compile(r"""<meta[^>]+name=["']csrf-token["'][^>]+content=["']([^"']+)["']""")
+ENTITY_FINDER = re.compile(r"&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);")
+CSRF_INPUT_FINDER = re.compile(
+    r"""(?s)<form[^>]+id=["']login-form-password["'](?:(?!</form>).)*?"""
+    r"""<input[^>]+name=["']authenticity_token["'][^>]+value=["']([^"']+)["']"""
+)
+
+
+@dataclass(slots=True)
 class Assets:
     icon: str | None
     poster: str | None
@@ -34,7 +71,7 @@ class Assets:
     thumb: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Collection:
     entity_id: int
     slug: str
@@ -48,7 +85,7 @@ class Collection:
     is_in_list: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Series:
     entity_id: int
     collection_page: str | None
@@ -64,26 +101,26 @@ class Series:
     is_in_list: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSeries:
     name: str
     id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSeason:
     name: str
     number: int
     episode_number: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoReleaseDate:
     date: datetime.date
     location: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UnreleasedVideo:
     entity_id: int
     title: str
@@ -97,7 +134,7 @@ class UnreleasedVideo:
     is_in_list: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleasedVideo:
     entity_id: int
     collection_id: int
@@ -121,13 +158,13 @@ class ReleasedVideo:
 Video = UnreleasedVideo | ReleasedVideo
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Movie(ReleasedVideo):
     assets: Assets
     trailer_url: str | int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class Season:
     entity_id: int
     title: str
@@ -145,20 +182,26 @@ Media = Collection | Series | Season | Video | Movie
 Playable = Video | Movie
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedMedia:
     items: list[Media]
     page: int
     next_page: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoData:
     subtitles: list[str]
     url: str
     mime_type: str
 
 
+def _last_seen(media: Media) -> datetime.datetime:
+    if isinstance(media, ReleasedVideo) and media.play_state is not None:
+        return media.play_state.last_seen
+    return datetime.datetime.min.replace(tzinfo=datetime.UTC)
+
+
 _VHX_SITE_ID = 36348
 _VHX_PRODUCT_ID = 28599
 _VHX_NEW_RELEASES_ID = 129054
@@ -169,6 +212,37 @@ _VHX_TRENDING_ID = 1151509
 # TODO: is it worth caching using If-None-Match?
 
 
+# the only entities seen in scraped URLs/tokens, "&amp;" must stay last so "&amp;lt;" becomes "&lt;"
+_COMMON_ENTITIES = {
+    "&quot;": '"',
+    "&#x2F;": "/",
+    "&#47;": "/",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&amp;": "&",
+}
+
+
+def _unescape(value: str) -> str:
+    if "&" not in value:
+        return value
+    if any(m.group(0) not in _COMMON_ENTITIES for m in ENTITY_FINDER.finditer(value)):
+        return html.unescape(value)
+    for entity, char in _COMMON_ENTITIES.items():
+        value = value.replace(entity, char)
+    return value
+
+
+def _new_session() -> requests.Session:
+    session = requests.session()
+    adapter = HTTPAdapter(
+        pool_connections=REQUEST_POOL_CONNECTIONS,
+        pool_maxsize=REQUEST_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 class API:
     WEBSITE_URL = "https://watch.dropout.tv"
     REFERER_URL = "https://watch.dropout.tv"
@@ -180,19 +254,48 @@ class API:
 
     def __init__(self, *, credentials: tuple[str, str]) -> None:
         self.__credentials = credentials
+        self.__hash: str | None = None
 
-        self.__session = requests.session()
-        cookies = requests.utils.cookiejar_from_dict(Addon.CONFIG.get_cookie_jar())
+        self.__session = _new_session()
+        cookies = requests.utils.cookiejar_from_dict(Addon.config().get_cookie_jar())
         self.__session.cookies.update(cookies)
-
-        self.__my_list: set[int] | None = None
+        self.__api_session = _new_session()
+        # kept apart from the website session so embed/player cookies never end up in the persisted cookie jar
+        self.__embed_session = _new_session()
+        self.__csrf_cache: dict[bool, tuple[str, datetime.datetime]] = {}
+        self.__video_cache: dict[int, dict] = {}
+        self.__movie_pages: dict[tuple[int, bool], PaginatedMedia] = {}
+        # (type, embedded) -> parser, so the embedded/top-level shape is picked once per item
+        self.__medium_parsers: dict[tuple[str | None, bool], Callable[[dict, bool, Mapping[int, PlayState]], Media]] = {
+            ("video", True): lambda item, _is_my_list, playstates: self.__parse_video_embedded(
+                item, playstates=playstates
+            ),
+            ("video", False): lambda item, _is_my_list, playstates: self.__parse_video_top(item, playstates=playstates),
+            ("movie", True): lambda item, is_my_list, _playstates: self.__parse_movie(
+                item, embedded=True, is_my_list=is_my_list
+            ),
+            ("movie", False): lambda item, is_my_list, _playstates: self.__parse_movie(
+                item, embedded=False, is_my_list=is_my_list
+            ),
+            ("season", True): lambda item, _is_my_list, _playstates: self.__parse_season(item),
+            ("season", False): lambda item, _is_my_list, _playstates: self.__parse_season(item),
+            ("series", True): lambda item, _is_my_list, _playstates: self.__parse_series_embedded(item),
+            ("series", False): lambda item, _is_my_list, _playstates: self.__parse_series_top(item),
+            (None, True): lambda item, _is_my_list, _playstates: self.__parse_collection(item, embedded=True),
+            (None, False): lambda item, _is_my_list, _playstates: self.__parse_collection(item, embedded=False),
+        }
+
+        self.__my_list: frozenset[int] | None = None
+        self.__prefetching = False
+        # (url, use_tv, params, cache) of the listing page last requested, see prefetch
+        self.__listing: tuple[str, bool, dict[str, Any], bool] | None = None
         self.__token = None
         self.__user_id = None
 
         self.logged_in = False
         self.has_subscription = False
 
-        creds = Addon.CONFIG.get_credentials()
+        creds = Addon.config().get_credentials()
 
         self.__ensure_logged_in(creds)
 
@@ -200,7 +303,7 @@ class API:
             assert self.__token is not None  # noqa: S101
             assert self.__user_id is not None  # noqa: S101
             log_message(f"caching credentials {self.__token}/{self.__user_id}", level=LOGDEBUG)
-            Addon.CONFIG.set_credentials(
+            Addon.config().set_credentials(
                 Credentials(
                     hash=self.__calculate_hash(),
                     token=self.__token,
@@ -210,15 +313,24 @@ class API:
             )
 
     def __calculate_hash(self) -> str:
-        username, password = self.__credentials
-        return hashlib.md5(f"{username}{password}".encode()).hexdigest()  # noqa: S324
+        if self.__hash is None:
+            username, password = self.__credentials
+            hasher = hashlib.md5(usedforsecurity=False)
+            hasher.update(username.encode())
+            hasher.update(password.encode())
+            self.__hash = hasher.hexdigest()
+        return self.__hash
 
     def __ensure_logged_in(self, creds: Credentials | None) -> bool:
         if creds is not None:
-            hashc = self.__calculate_hash()
-            now = datetime.datetime.now(tz=datetime.UTC)
-            if hashc == creds.hash and now - creds.when < datetime.timedelta(minutes=5):
-                self.__token = creds.token
+            age = datetime.datetime.now(tz=datetime.UTC) - creds.when
+            # check the expiry first, there is no need to hash the credentials if the cache is stale anyway
+            if age >= datetime.timedelta(minutes=5):
+                log_message(f"not using cache, expired {age}", level=LOGDEBUG)
+            elif (hashc := self.__calculate_hash()) != creds.hash:
+                log_message(f"not using cache {hashc} != {creds.hash}", level=LOGDEBUG)
+            else:
+                self.__set_token(creds.token)
                 self.__user_id = creds.user_id
                 self.logged_in = True
                 self.has_subscription = True
@@ -227,11 +339,7 @@ class API:
                     level=LOGDEBUG,
                 )
                 return True
-            log_message(
-                f"not using cash {hashc} != {creds.hash} or expired {now - creds.when}",
-                level=LOGDEBUG,
-            )
-            Addon.CONFIG.set_credentials(None)
+            Addon.config().set_credentials(None)
 
         if self.__update_from_website():
             return True
@@ -260,6 +368,8 @@ class API:
                 "utf8": True,
             },
         )
+        # the session (and its CSRF token) is rotated on login
+        self.__csrf_cache.clear()
         if not res.ok:
             log_message(
                 f"login failed with {res.text}",
@@ -278,10 +388,10 @@ class API:
         return False
 
     def __update_token(self) -> bool:
-        res = self.__website_request("/")
-        token_info = re.search(TOKEN_FINDER, res.text)
-        user_info = re.search(USER_FINDER, res.text)
-        self.__token = token_info.group(1) if token_info is not None else None
+        body = self.__website_request("/").text
+        token_info = TOKEN_FINDER.search(body)
+        user_info = USER_FINDER.search(body)
+        self.__set_token(token_info.group(1) if token_info is not None else None)
         self.__user_id = int(user_info.group(1)) if user_info is not None else None
         log_message(
             f"updating token with {token_info}/{user_info} => token={self.__token}, user_id={self.__user_id}",
@@ -291,11 +401,11 @@ class API:
 
     def __update_status(self) -> bool:
         res = self.__website_request("/customer_settings/subscription_plans")
-        sub_plan = res.json()
+        sub_plan = _json_loads(res.content)
         self.logged_in = sub_plan is not None
         self.has_subscription = sub_plan is not None and not sub_plan.get("current_plan", {}).get("has_expired", True)
         log_message(
-            (
+            lambda: (
                 f"updating status with {res}/{sub_plan} => logged_in={self.logged_in}, "
                 f"has_subscription={self.has_subscription}"
             ),
@@ -306,9 +416,21 @@ class API:
         return sub_plan is not None
 
     def __get_authenticity_token(self, *, meta: bool = False) -> str:
+        now = datetime.datetime.now(tz=datetime.UTC)
+        cached = self.__csrf_cache.get(meta)
+        if cached is not None and now - cached[1] < CSRF_TOKEN_TTL:
+            return cached[0]
+        token = self.__fetch_authenticity_token(meta=meta)
+        self.__csrf_cache[meta] = (token, now)
+        return token
+
+    def __fetch_authenticity_token(self, *, meta: bool = False) -> str:
         if meta:
             res = self.__website_request("/")
-            soup = BeautifulSoup(res.text, "html.parser")
+            token_info = CSRF_META_FINDER.search(res.text)
+            if token_info is not None:
+                return _unescape(token_info.group(1))
+            soup = BeautifulSoup(res.text, _HTML_PARSER)
             meta_tag = soup.find("meta", {"name": "csrf-token"})
             if meta_tag is None:
                 msg = "internal error: could not get authenticity token (meta not found)"
@@ -320,7 +442,10 @@ class API:
             return str(token)
 
         res = self.__website_request("/login")
-        soup = BeautifulSoup(res.text, "html.parser")
+        token_info = CSRF_INPUT_FINDER.search(res.text)
+        if token_info is not None:
+            return _unescape(token_info.group(1))
+        soup = BeautifulSoup(res.text, _HTML_PARSER)
 
         form = soup.find(id="login-form-password")
         if form is None:
@@ -344,7 +469,7 @@ class API:
         data: dict[str, Any] | None = None,
     ) -> requests.Response:
         log_message(
-            f"making website request to {url} with data={data} and cookies={self.__session.cookies}",
+            lambda: f"making website request to {url} with data={data} and cookies={self.__session.cookies}",
             level=LOGNONE,
         )
         rep = self.__session.request(
@@ -353,9 +478,11 @@ class API:
             data=data,
             timeout=REQUEST_TIMEOUT_S,
         )
-        Addon.CONFIG.set_cookie_jar(requests.utils.dict_from_cookiejar(self.__session.cookies))
+        Addon.config().set_cookie_jar(requests.utils.dict_from_cookiejar(self.__session.cookies))
+        if rep.status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+            self.__csrf_cache.clear()
         log_message(
-            f"website request to {url} returned {rep.status_code} with {rep.text}",
+            lambda: f"website request to {url} returned {rep.status_code} with {rep.text}",
             level=LOGNONE,
         )
         return rep
@@ -371,9 +498,21 @@ class API:
         self.__clear_auth_data()
 
     def __clear_auth_data(self) -> None:
-        Addon.CONFIG.set_cookie_jar({})
+        Addon.config().set_cookie_jar({})
+        Addon.config().clear_titles()
+        Addon.config().clear_prefetched()
+        Addon.config().clear_cached_responses()
         self.__session.cookies.clear()
-        self.__token = None
+        self.__csrf_cache.clear()
+        self.__video_cache.clear()
+        self.__set_token(None)
+
+    def __set_token(self, token: str | None) -> None:
+        self.__token = token
+        if token is None:
+            self.__api_session.headers.pop("Authorization", None)
+        else:
+            self.__api_session.headers["Authorization"] = f"Bearer {token}"
 
     def __ensure_has_my_list(self) -> None:
         if self.__my_list is not None:
@@ -390,7 +529,7 @@ class API:
             use_tv=True,
         )
         final = self.__parse_media(res, from_tv=True, fast=True, is_my_list=True)
-        self.__my_list = {i.entity_id for i in final}
+        self.__my_list = frozenset(i.entity_id for i in final)
 
     def get_new_releases(self, *, page: int = 1) -> PaginatedMedia:
         self.__ensure_has_my_list()
@@ -409,43 +548,35 @@ class API:
             use_tv=False,
         )
         res = self.__parse_com_page(res, page)
-        log_message(f"continue watching [FROM API]: {res}", level=LOGDEBUG)
-        res.items = list(
-            filter(
-                lambda i: (
-                    not isinstance(i, ReleasedVideo)
-                    or i.play_state is None
-                    or not i.play_state.completed
-                    or not i.play_state.from_us
-                ),
-                res.items,
-            )
-        )
-        log_message(f"continue watching [FILTERED]: {res}", level=LOGDEBUG)
+        log_message(lambda: f"continue watching [FROM API]: {res}", level=LOGDEBUG)
+        all_play_states = Addon.config().get_playstates() if page == 1 else {}
+        items = []
+        for i in res.items:
+            ps = i.play_state if isinstance(i, ReleasedVideo) else None
+            if ps is not None and ps.completed and ps.from_us:
+                continue
+            items.append(i)
+            if isinstance(i, Video):
+                all_play_states.pop(i.entity_id, None)
+        res.items = items
+        log_message(lambda: f"continue watching [FILTERED]: {res}", level=LOGDEBUG)
         if page == 1:
-            all_play_states = Addon.CONFIG.get_playstates()
-            for i in res.items:
-                if isinstance(i, Video) and i.entity_id in all_play_states:
-                    del all_play_states[i.entity_id]
-            all_play_states = dict(filter(lambda i: not i[1].completed, all_play_states.items()))
-            log_message(f"continue watching [FROM CONFIG]: {all_play_states}", level=LOGDEBUG)
-            extras = [self.__parse_playable(self.__get_video_by_id(i), embedded=True) for i in all_play_states]
-            res.items.extend(extras)
-            res.items = sorted(
-                res.items,
-                key=lambda i: (
-                    i.play_state.last_seen
-                    if isinstance(i, ReleasedVideo) and i.play_state is not None
-                    else datetime.datetime.min
-                ),
-                reverse=True,
-            )
-        log_message(f"continue watching [WITH OURS]: {res}", level=LOGDEBUG)
+            all_play_states = {k: v for k, v in all_play_states.items() if not v.completed}
+            log_message(lambda: f"continue watching [FROM CONFIG]: {all_play_states}", level=LOGDEBUG)
+            with ThreadPoolExecutor(max_workers=REQUEST_MAX_WORKERS) as executor:
+                res.items.extend(
+                    executor.map(
+                        lambda i: self.__parse_playable(self.__get_video_by_id(i), embedded=True),
+                        all_play_states,
+                    )
+                )
+            res.items.sort(key=_last_seen, reverse=True)
+        log_message(lambda: f"continue watching [WITH OURS]: {res}", level=LOGDEBUG)
         return res
 
     def get_my_list(self, *, page: int = 1) -> PaginatedMedia:
         url = f"/customers/{self.__user_id}/watchlist"
-        res = self.__api_request(
+        res = self.__request_listing(
             url,
             params={
                 "page": page,
@@ -458,8 +589,16 @@ class API:
         )
         return self.__parse_tv_page(res, page, is_my_list=True)
 
-    def __get_from_collection(self, *, page: int, collection: int, is_my_list: bool = False) -> PaginatedMedia:
-        res = self.__api_request(
+    def __get_from_collection(
+        self,
+        *,
+        page: int,
+        collection: int,
+        is_my_list: bool = False,
+        listing: bool = True,
+    ) -> PaginatedMedia:
+        request = self.__request_listing if listing else self.__api_request
+        res = request(
             f"/collections/{collection}/items",
             params={
                 "page": page,
@@ -468,12 +607,34 @@ class API:
                 "include_products_for": "web",
             },
             use_tv=False,
+            cache=True,
         )
         return self.__parse_com_page(res, page, is_my_list=is_my_list)
 
+    def __get_movie_page(self, collection: int, *, is_my_list: bool) -> PaginatedMedia:
+        key = (collection, is_my_list)
+        page = self.__movie_pages.get(key)
+        if page is None:
+            page = self.__get_from_collection(page=1, collection=collection, is_my_list=is_my_list, listing=False)
+            self.__movie_pages[key] = page
+        return page
+
+    def __prefetch_movie_pages(self, items: list[dict], *, is_my_list: bool) -> None:
+        collections = []
+        for item in items:
+            entity = item.get("entity", item)
+            if entity.get("type") == "movie" and (entity["id"], is_my_list) not in self.__movie_pages:
+                collections.append(entity["id"])
+        if len(collections) <= 1:
+            return
+        # failures are left in their futures, __parse_movie will retry (and report) them
+        with ThreadPoolExecutor(max_workers=REQUEST_MAX_WORKERS) as executor:
+            for collection in collections:
+                executor.submit(self.__get_movie_page, collection, is_my_list=is_my_list)
+
     def search(self, *, query: str, page: int) -> PaginatedMedia:
         self.__ensure_has_my_list()
-        res = self.__api_request(
+        res = self.__request_listing(
             "/search",
             params={
                 "q": query,
@@ -491,7 +652,7 @@ class API:
             msg = f"could not get collection {collection}"
             raise ValueError(msg)
         log_message(
-            f"collection {collection}: {res}",
+            lambda: f"collection {collection}: {res}",
             level=LOGDEBUG,
         )
         if res["type"] not in types:
@@ -506,10 +667,10 @@ class API:
         )
 
     def get_series(self, series: int) -> Series:
-        return self.__parse_series(self.__get_collection(series, types=["series"]))
+        return self.__parse_series_top(self.__get_collection(series, types=["series"]))
 
     def get_season(self, season: int) -> Series:
-        return self.__parse_series(self.__get_collection(season, types=["season"]))
+        return self.__parse_series_top(self.__get_collection(season, types=["season"]))
 
     def get_collection_items(self, *, page: int, collection: int) -> PaginatedMedia:
         self.__ensure_has_my_list()
@@ -525,7 +686,7 @@ class API:
 
     def get_featured(self, *, page: int = 1) -> PaginatedMedia:
         self.__ensure_has_my_list()
-        res = self.__api_request(
+        res = self.__request_listing(
             "/products/featured_items",
             params={
                 "page": page,
@@ -533,12 +694,13 @@ class API:
                 "site_id": _VHX_SITE_ID,
             },
             use_tv=True,
+            cache=True,
         )
         return self.__parse_tv_page(res, page)
 
     def get_browse(self, *, page: int = 1) -> PaginatedMedia:
         self.__ensure_has_my_list()
-        res = self.__api_request(
+        res = self.__request_listing(
             "/browse",
             params={
                 "page": page,
@@ -549,6 +711,7 @@ class API:
                 "site_id": _VHX_SITE_ID,
             },
             use_tv=True,
+            cache=True,
         )
         return self.__parse_tv_page(res, page)
 
@@ -571,8 +734,42 @@ class API:
             params=params,
             use_tv=True,
         )
+        # prefetched pages would be missing the change
+        Addon.config().clear_prefetched()
         return res is not None
 
+    def prefetch(self, *, page: int) -> None:
+        """Request another page of the last listing and store the raw response, the next plugin invocation reuses it.
+
+        Nothing is parsed: play states and movie pages are only looked up when the page is actually shown.
+        """
+        if self.__listing is None:
+            return
+        url, use_tv, params, cache = self.__listing
+        self.__prefetching = True
+        try:
+            self.__api_request(url, use_tv=use_tv, params={**params, "page": page}, cache=cache)
+        except Exception:  # noqa: BLE001
+            log_exception("could not prefetch")
+        finally:
+            self.__prefetching = False
+
+    def __request_listing(
+        self,
+        url: str,
+        *,
+        use_tv: bool,
+        params: dict[str, Any],
+        cache: bool = False,
+    ) -> dict | None:
+        self.__listing = (url, use_tv, params, cache)
+        return self.__api_request(url, use_tv=use_tv, params=params, cache=cache)
+
+    def __api_url(self, url: str, *, use_tv: bool) -> str:
+        if use_tv:
+            return f"{self.API_URL_TV}{url}"
+        return f"{self.API_URL_COM}{self.API_PREFIX}{url}"
+
     def __api_request(
         self,
         url: str,
@@ -580,21 +777,26 @@ class API:
         use_tv: bool,
         method: str = "GET",
         params: dict[str, Any] | None = None,
+        cache: bool = False,
     ) -> dict | None:
-        base = self.API_URL_TV if use_tv else self.API_URL_COM
-        extra_parts = [self.API_PREFIX] if not use_tv else []
-        next_url = "".join([base, *extra_parts, url])
+        next_url = self.__api_url(url, use_tv=use_tv)
+        # only listing pages are prefetched, other responses (e.g. play states) must stay fresh;
+        # catalog pages (`cache`) are the same for everyone and kept for a few minutes instead of used once
+        page_key = None
+        if method == "GET" and params is not None and "page" in params:
+            page_key = f"{next_url}?{urlencode(sorted(params.items()))}"
+            stored = self.__stored_page(page_key, cache=cache)
+            if stored is not None:
+                log_message(f"using stored {page_key}", level=LOGDEBUG)
+                return stored
         log_message(
             f"making api request to {url} ({next_url}) with params={params} and token={self.__token}",
             level=LOGDEBUG,
         )
-        res = requests.request(
+        res = self.__api_session.request(
             method,
             next_url,
             params=params,
-            headers={
-                "Authorization": f"Bearer {self.__token}",
-            },
             timeout=REQUEST_TIMEOUT_S,
         )
         if not res.ok:
@@ -606,15 +808,28 @@ class API:
 
         out = {}
         if res.status_code != 204:  # noqa: PLR2004
-            out = res.json()
+            out = _json_loads(res.content)
 
         log_message(
-            f"api request to {url} ({next_url}) returned {res.status_code} with {out}",
+            lambda: f"api request to {url} ({next_url}) returned {res.status_code} with {out}",
             level=LOGDEBUG,
         )
 
+        if page_key is not None:
+            if cache:
+                Addon.config().set_cached_response(page_key, out)
+            elif self.__prefetching:
+                Addon.config().set_prefetched(page_key, out)
         return out
 
+    def __stored_page(self, page_key: str, *, cache: bool) -> dict | None:
+        if cache:
+            return Addon.config().get_cached_response(page_key)
+        # a prefetch must not consume the page it is about to store
+        if self.__prefetching:
+            return None
+        return Addon.config().pop_prefetched(page_key)
+
     def __api_request_pages(
         self,
         url: str,
@@ -622,55 +837,41 @@ class API:
         use_tv: bool,
         params: dict[str, Any] | None = None,
     ) -> list[dict]:
-        base_url = self.API_URL_TV if use_tv else self.API_URL_COM
-        extra_parts = [self.API_PREFIX] if not use_tv else []
-        next_url = "".join([base_url, *extra_parts, url])
+        next_url = self.__api_url(url, use_tv=use_tv)
         log_message(
             f"making api request pages to {url} ({next_url}) with params={params} and token={self.__token}",
             level=LOGDEBUG,
         )
         items = []
         while True:
-            res = requests.get(
-                next_url,
-                params=params,
-                headers={
-                    "Authorization": f"Bearer {self.__token}",
-                },
-                timeout=REQUEST_TIMEOUT_S,
-            )
-            if not res.ok:
-                msg = f"api request pages to {url} ({next_url}) failed with {res.status_code} and {res.text}"
-                if Addon.debug():
-                    raise ValueError(msg)
-                log_message(msg, level=LOGERROR)
+            data = self.__api_request_page(url, next_url, params=params)
+            if data is None:
                 break
-            log_message(
-                f"api request pages to {url} ({next_url}) returned {res.status_code}",
-                level=LOGDEBUG,
-            )
-            log_message(
-                f"api request pages to {url} ({next_url}) returned {res.status_code} with {res.json()}",
-                level=LOGNONE,
-            )
-
-            data = res.json()
-            data_with_items = data
-            if use_tv:
-                data_with_items = data.get("_embedded", {})
-            items.extend(data_with_items.get("items", []))
 
             if use_tv:
+                items.extend(data.get("_embedded", {}).get("items", []))
                 next_url = data.get("_links", {}).get("next", {}).get("href")
                 if next_url is None:
                     break
-            else:
-                pagination = data.get("pagination", {})
-                if pagination["count"] <= pagination["page"] * pagination["per_page"]:
-                    break
-                next_url = pagination["template_url"].format(
-                    page=pagination["page"] + 1, per_page=pagination["per_page"]
-                )
+                continue
+
+            items.extend(data.get("items", []))
+            pagination = data.get("pagination", {})
+            count, page_n, per_page = pagination["count"], pagination["page"], pagination["per_page"]
+            if count <= page_n * per_page:
+                break
+            # every remaining page URL is known upfront, fetch them concurrently
+            template_url = pagination["template_url"]
+            next_urls = [
+                template_url.format(page=page, per_page=per_page)
+                for page in range(page_n + 1, math.ceil(count / per_page) + 1)
+            ]
+            with ThreadPoolExecutor(max_workers=REQUEST_MAX_WORKERS) as executor:
+                for page_data in executor.map(lambda u: self.__api_request_page(url, u, params=params), next_urls):
+                    if page_data is None:
+                        break
+                    items.extend(page_data.get("items", []))
+            break
         log_message(
             f"finished request to {url} with {len(items)} items",
             level=LOGDEBUG,
@@ -678,6 +879,29 @@ class API:
 
         return items
 
+    def __api_request_page(self, url: str, next_url: str, *, params: dict[str, Any] | None) -> dict | None:
+        res = self.__api_session.get(
+            next_url,
+            params=params,
+            timeout=REQUEST_TIMEOUT_S,
+        )
+        if not res.ok:
+            msg = f"api request pages to {url} ({next_url}) failed with {res.status_code} and {res.text}"
+            if Addon.debug():
+                raise ValueError(msg)
+            log_message(msg, level=LOGERROR)
+            return None
+        log_message(
+            f"api request pages to {url} ({next_url}) returned {res.status_code}",
+            level=LOGDEBUG,
+        )
+        data = _json_loads(res.content)
+        log_message(
+            lambda: f"api request pages to {url} ({next_url}) returned {res.status_code} with {data}",
+            level=LOGNONE,
+        )
+        return data
+
     def __parse_com_page(
         self,
         res: dict | None,
@@ -690,11 +914,12 @@ class API:
             return PaginatedMedia(items=[], page=current_page, next_page=None)
         next_page = None
         pagination = res["pagination"]
-        if pagination["count"] >= pagination["page"] * pagination["per_page"]:
-            next_page = pagination["page"] + 1
+        page_n = pagination["page"]
+        if pagination["count"] >= page_n * pagination["per_page"]:
+            next_page = page_n + 1
         return PaginatedMedia(
             items=self.__parse_media(res[items], from_tv=False, is_my_list=is_my_list),
-            page=pagination["page"],
+            page=page_n,
             next_page=next_page,
         )
 
@@ -710,54 +935,36 @@ class API:
             next_page=next_page,
         )
 
-    def __parse_medium(self, item: dict, *, from_tv: bool, is_my_list: bool = False) -> tuple[Media, bool]:  # noqa: ARG002
+    def __parse_medium(
+        self,
+        item: dict,
+        *,
+        from_tv: bool,  # noqa: ARG002
+        playstates: Mapping[int, PlayState],
+        is_my_list: bool = False,
+    ) -> tuple[Media, bool]:
         is_embedded = True
         if "entity" in item:
             item = item["entity"]
             is_embedded = False
+        kind = item.get("type")
+        parser = self.__medium_parsers.get((kind, is_embedded))
+        if parser is None:
+            msg = f"unknown type {item['type']}"
+            raise ValueError(msg)
+        log_message(
+            lambda: f"found {kind or 'collection'} {item}, embedded={is_embedded}",
+            level=LOGDEBUG,
+        )
+        media = parser(item, is_my_list, playstates)
         need_play_state = False
-        match item.get("type"):
-            case "video":
-                log_message(
-                    f"found video {item}, embedded={is_embedded}",
-                    level=LOGDEBUG,
-                )
-                media = self.__parse_video(item, embedded=is_embedded)
-                if "_embedded" in item and "play_state" in item["_embedded"] and isinstance(media, ReleasedVideo):
-                    media.play_state = self.__if_more_recent(
-                        media.play_state,
-                        self.__parse_play_state(item["_embedded"]["play_state"]),
-                    )
-                else:
-                    need_play_state = isinstance(media, ReleasedVideo)
-            case "movie":
-                log_message(
-                    f"found movie {item}, embedded={is_embedded}",
-                    level=LOGDEBUG,
-                )
-                media = self.__parse_movie(item, embedded=is_embedded, is_my_list=is_my_list)
+        # videos and movies (a Movie is a ReleasedVideo), only video items embed their play state
+        if isinstance(media, ReleasedVideo):
+            embedded_data = item.get("_embedded", {})
+            if kind == "video" and "play_state" in embedded_data:
+                media.play_state = self.__if_more_recent(media.play_state, embedded_data["play_state"])
+            else:
                 need_play_state = True
-            case "season":
-                log_message(
-                    f"found season {item}, embedded={is_embedded}",
-                    level=LOGDEBUG,
-                )
-                media = self.__parse_season(item, embedded=is_embedded)
-            case "series":
-                log_message(
-                    f"found series {item}, embedded={is_embedded}",
-                    level=LOGDEBUG,
-                )
-                media = self.__parse_series(item, embedded=is_embedded)
-            case None:
-                log_message(
-                    f"found collection {item}, embedded={is_embedded}",
-                    level=LOGDEBUG,
-                )
-                media = self.__parse_collection(item, embedded=is_embedded)
-            case _:
-                msg = f"unknown type {item['type']}"
-                raise ValueError(msg)
         if is_my_list:
             media.is_in_list = True
         elif self.__my_list is not None:
@@ -773,16 +980,19 @@ class API:
         is_my_list: bool = False,
     ) -> list[Media]:
         out = []
-        videos = []
+        pending: list[ReleasedVideo] = []
+        playstates = Addon.config().get_playstate_map()
+        self.__prefetch_movie_pages(items, is_my_list=is_my_list)
         for item in items:
             try:
                 media, need_play_state = self.__parse_medium(
                     item,
                     from_tv=from_tv,
+                    playstates=playstates,
                     is_my_list=is_my_list,
                 )
-                if need_play_state:
-                    videos.append(len(out))
+                if need_play_state and isinstance(media, ReleasedVideo):
+                    pending.append(media)
                 out.append(media)
             except ValueError as e:
                 log_message(
@@ -790,21 +1000,18 @@ class API:
                     level=LOGWARNING,
                 )
 
-        if len(videos) > 0 and not fast:
-            lookup = {out[i].entity_id: i for i in videos}
+        if len(pending) > 0 and not fast:
+            lookup = {m.entity_id: m for m in pending}
             pstates = self.__get_play_state(list(lookup.keys()))
             for ps in pstates:
-                i = lookup.get(ps["video_id"])
-                if i is None:
+                vid = lookup.get(ps["video_id"])
+                if vid is None:
                     log_message(
                         f"could not find video {ps['video_id']} in lookup",
                         level=LOGWARNING,
                     )
                     continue
-                vid = out[i]
-                if not isinstance(vid, ReleasedVideo):
-                    continue  # internal error!
-                vid.play_state = self.__if_more_recent(vid.play_state, self.__parse_play_state(ps))
+                vid.play_state = self.__if_more_recent(vid.play_state, ps)
 
         return out
 
@@ -817,7 +1024,7 @@ class API:
             if "_embedded" in item and "play_state" in item["_embedded"]:
                 media.play_state = self.__if_more_recent(
                     media.play_state,
-                    self.__parse_play_state(item["_embedded"]["play_state"]),
+                    item["_embedded"]["play_state"],
                 )
                 return media
         elif item.get("type") == "movie":
@@ -828,16 +1035,15 @@ class API:
         play_states = self.__get_play_state([media.entity_id])
         for ps in play_states:
             if ps["video_id"] == media.entity_id:
-                media.play_state = self.__if_more_recent(media.play_state, self.__parse_play_state(ps))
+                media.play_state = self.__if_more_recent(media.play_state, ps)
                 break
         return media
 
-    def __if_more_recent(self, current: PlayState | None, parsed: PlayState) -> PlayState:
-        if current is None:
-            return parsed
-        if parsed.last_seen > current.last_seen:
-            return parsed
-        return current
+    def __if_more_recent(self, current: PlayState | None, ps: dict) -> PlayState:
+        # compare the raw timestamp first so we only build a PlayState when it wins
+        if current is not None and ps["timestamp"] <= current.last_seen.timestamp():
+            return current
+        return self.__parse_play_state(ps)
 
     def __parse_play_state(self, ps: dict) -> PlayState:
         return PlayState(
@@ -848,6 +1054,13 @@ class API:
         )
 
     def __get_play_state(self, video_ids: list[int]) -> list[dict]:
+        if len(video_ids) <= PLAY_STATE_BATCH_SIZE:
+            return self.__get_play_state_batch(video_ids)
+        batches = [video_ids[i : i + PLAY_STATE_BATCH_SIZE] for i in range(0, len(video_ids), PLAY_STATE_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=REQUEST_MAX_WORKERS) as executor:
+            return list(itertools.chain.from_iterable(executor.map(self.__get_play_state_batch, batches)))
+
+    def __get_play_state_batch(self, video_ids: list[int]) -> list[dict]:
         data = self.__api_request(
             f"/users/{self.__user_id}/play_state",
             params={"video_ids": ",".join(map(str, video_ids))},
@@ -857,63 +1070,116 @@ class API:
             return []
         return data["entries"]
 
-    def __parse_video(self, item: dict, *, embedded: bool = False) -> Video:
-        dateformat = "%Y-%m-%dT%H:%M:%S.%fZ" if not embedded else "%Y-%m-%dT%H:%M:%SZ"
+    def __parse_video(
+        self,
+        item: dict,
+        *,
+        embedded: bool = False,
+        playstates: Mapping[int, PlayState] | None = None,
+    ) -> Video:
+        if embedded:
+            return self.__parse_video_embedded(item, playstates=playstates)
+        return self.__parse_video_top(item, playstates=playstates)
+
+    def __parse_video_top(self, item: dict, *, playstates: Mapping[int, PlayState] | None = None) -> Video:
         if "metadata" not in item:
-            return UnreleasedVideo(
-                entity_id=item["id"],
-                title=item["title"],
-                trailer_slug=item["url"],
-                short_description=item["short_description"],
-                description=item["description"],
-                duration_s=item["duration"]["seconds"],
-                thumbnail=item["thumbnail"]["source"],
-                created_at=datetime.datetime.strptime(item["created_at"], dateformat),
-                updated_at=datetime.datetime.strptime(item["updated_at"], dateformat),
-            )
+            return self.__parse_unreleased_video(item)
         metadata = item["metadata"]
         series = None
+        series_meta = metadata["series"]
+        series_name = series_meta["name"]
+        if series_name is not None:
+            series = VideoSeries(
+                name=series_name,
+                id=int(series_meta["id"]),
+            )
         season = None
-        if not embedded:
-            if metadata["series"]["name"] is not None:
-                series = VideoSeries(
-                    name=metadata["series"]["name"],
-                    id=int(metadata["series"]["id"]),
-                )
-        elif "series_name" in metadata and "series_id" in metadata:
+        season_meta = metadata["season"]
+        season_name = season_meta["name"]
+        if season_name is not None:
+            episode_number = season_meta.get("episode_number")
+            season = VideoSeason(
+                name=season_name,
+                number=int(season_meta["number"]),
+                episode_number=int(episode_number) if episode_number else None,
+            )
+        return self.__released_video(
+            item,
+            series=series,
+            season=season,
+            rdates=metadata["release_dates"],
+            thumbnail=item["thumbnails"]["16_9"]["source"],
+            url=item["page_url"],
+            slug=item["slug"],
+            tags=metadata["tags"],
+            playstates=playstates,
+        )
+
+    def __parse_video_embedded(self, item: dict, *, playstates: Mapping[int, PlayState] | None = None) -> Video:
+        if "metadata" not in item:
+            return self.__parse_unreleased_video(item)
+        metadata = item["metadata"]
+        series = None
+        if "series_name" in metadata and "series_id" in metadata:
             series = VideoSeries(
                 name=metadata["series_name"],
                 id=int(metadata["series_id"]),
             )
-        if not embedded:
-            if metadata["season"]["name"] is not None:
-                season = VideoSeason(
-                    name=metadata["season"]["name"],
-                    number=int(metadata["season"]["number"]),
-                    episode_number=int(metadata["season"]["episode_number"])
-                    if metadata["season"].get("episode_number")
-                    else None,
-                )
-        elif "season_name" in metadata and "season_number" in metadata:
+        season = None
+        if "season_name" in metadata and "season_number" in metadata:
+            episode_number = metadata.get("episode_number")
             season = VideoSeason(
                 name=metadata["season_name"],
                 number=int(metadata["season_number"]),
-                episode_number=int(metadata["episode_number"]) if metadata.get("episode_number") else None,
+                episode_number=int(episode_number) if episode_number else None,
             )
-        rdates = metadata["release_dates"] if not embedded else item["release_dates"]
+        return self.__released_video(
+            item,
+            series=series,
+            season=season,
+            rdates=item["release_dates"],
+            thumbnail=item["thumbnail"]["source"],
+            url=item["_links"]["video_page"],
+            slug=item["url"],
+            tags=item["tags"],
+            playstates=playstates,
+        )
+
+    def __parse_unreleased_video(self, item: dict) -> UnreleasedVideo:
+        return UnreleasedVideo(
+            entity_id=item["id"],
+            title=item["title"],
+            trailer_slug=item["url"],
+            short_description=item["short_description"],
+            description=item["description"],
+            duration_s=item["duration"]["seconds"],
+            thumbnail=item["thumbnail"]["source"],
+            created_at=_parse_datetime(item["created_at"]),
+            updated_at=_parse_datetime(item["updated_at"]),
+        )
+
+    def __released_video(  # noqa: PLR0913
+        self,
+        item: dict,
+        *,
+        series: VideoSeries | None,
+        season: VideoSeason | None,
+        rdates: list[dict] | None,
+        thumbnail: str,
+        url: str,
+        slug: str,
+        tags: list[str] | None,
+        playstates: Mapping[int, PlayState] | None,
+    ) -> ReleasedVideo:
         release_dates = None
         if rdates is not None:
             release_dates = [
                 VideoReleaseDate(
-                    date=datetime.datetime.strptime(rdate["date"], "%Y-%m-%d").date(),
+                    date=datetime.date.fromisoformat(rdate["date"]),
                     location=rdate["location"],
                 )
                 for rdate in rdates
             ]
-        thumbnail = item["thumbnails"]["16_9"]["source"] if not embedded else item["thumbnail"]["source"]
-        url = item["page_url"] if not embedded else item["_links"]["video_page"]
-        slug = item["slug"] if not embedded else item["url"]
-        tags = metadata["tags"] if not embedded else item["tags"]
         return ReleasedVideo(
             entity_id=item["id"],
             collection_id=item["canonical_collection_id"],
@@ -928,48 +1194,53 @@ class API:
             thumbnail=thumbnail,
             tags=tags if tags is not None else [],
             release_dates=release_dates,
-            created_at=datetime.datetime.strptime(item["created_at"], dateformat),
-            updated_at=datetime.datetime.strptime(item["updated_at"], dateformat),
-            play_state=Addon.CONFIG.get_playstate(item["id"]),
+            created_at=_parse_datetime(item["created_at"]),
+            updated_at=_parse_datetime(item["updated_at"]),
+            play_state=playstates.get(item["id"])
+            if playstates is not None
+            else Addon.config().get_playstate(item["id"]),
         )
 
     def __assets_from_item(self, item: dict, *, embedded: bool = False) -> Assets:
-        assets = None
         if embedded:
-            adds = item["additional_images"]
-            assets = Assets(
-                icon=adds["aspect_ratio_1_1"]["source"] if "aspect_ratio_1_1" in adds else None,
-                poster=adds["aspect_ratio_2_3"]["source"] if "aspect_ratio_2_3" in adds else None,
-                fanart=adds["aspect_ratio_16_9_background"]["source"],
-                landscape=adds["aspect_ratio_16_9_background"]["source"],
-                banner=adds["aspect_ratio_16_6"]["source"] if adds["aspect_ratio_16_6"] is not None else None,
-                thumb=item["thumbnail"]["source"],
-            )
-        else:
-            thumbs = item["thumbnails"]
-            t16_9 = thumbs["16_9"]["source"]
-            t16_9_bg = thumbs["16_9_background"]
-            t16_9_bg = t16_9_bg["source"] if t16_9_bg is not None else t16_9
-            assets = Assets(
-                icon=thumbs["1_1"]["source"],
-                poster=thumbs["2_3"]["source"],
-                fanart=t16_9_bg,
-                landscape=t16_9_bg,
-                banner=thumbs["16_6"]["source"] if thumbs.get("16_6") is not None else None,
-                thumb=t16_9,
-            )
-        return assets
+            return self.__assets_from_embedded_item(item)
+        return self.__assets_from_top_item(item)
+
+    def __assets_from_embedded_item(self, item: dict) -> Assets:
+        adds = item["additional_images"]
+        icon = adds.get("aspect_ratio_1_1")
+        poster = adds.get("aspect_ratio_2_3")
+        background = adds["aspect_ratio_16_9_background"]["source"]
+        banner = adds["aspect_ratio_16_6"]
+        return Assets(
+            icon=icon["source"] if icon is not None else None,
+            poster=poster["source"] if poster is not None else None,
+            fanart=background,
+            landscape=background,
+            banner=banner["source"] if banner is not None else None,
+            thumb=item["thumbnail"]["source"],
+        )
+
+    def __assets_from_top_item(self, item: dict) -> Assets:
+        thumbs = item["thumbnails"]
+        t16_9 = thumbs["16_9"]["source"]
+        t16_9_bg = thumbs["16_9_background"]
+        t16_9_bg = t16_9_bg["source"] if t16_9_bg is not None else t16_9
+        t16_6 = thumbs.get("16_6")
+        return Assets(
+            icon=thumbs["1_1"]["source"],
+            poster=thumbs["2_3"]["source"],
+            fanart=t16_9_bg,
+            landscape=t16_9_bg,
+            banner=t16_6["source"] if t16_6 is not None else None,
+            thumb=t16_9,
+        )
 
     def __parse_movie(self, item: dict, *, embedded: bool = False, is_my_list: bool = False) -> Movie:
         trailer_url = item.get("trailer_url") if embedded else item.get("trailer_video_id")
-        page = self.__get_from_collection(page=1, collection=item["id"], is_my_list=is_my_list)
-        vid = None
-        for i in page.items:
-            if not isinstance(i, Video):
-                continue
-            if vid is None or vid.duration_s > i.duration_s:
-                vid = i
-                break
+        page = self.__get_movie_page(item["id"], is_my_list=is_my_list)
+        # the first video of the collection is the movie itself (the old min-duration loop broke on the first match)
+        vid = next((i for i in page.items if isinstance(i, Video)), None)
         # FIXME: are some video unavailable then?
         if vid is None:
             msg = f"invalid type for collection (movie) {item['id']}: {page.items}"
@@ -1006,8 +1277,7 @@ class API:
             trailer_url=trailer_url,
         )
 
-    def __parse_season(self, item: dict, *, embedded: bool = False) -> Season:
-        dateformat = "%Y-%m-%dT%H:%M:%S.%fZ" if not embedded else "%Y-%m-%dT%H:%M:%SZ"
+    def __parse_season(self, item: dict) -> Season:
         return Season(
             entity_id=item["id"],
             title=item["title"],
@@ -1016,49 +1286,59 @@ class API:
             episodes_count=item["episodes_count"],
             trailer_url=item.get("trailer_video_id"),
             thumbnail=item["thumbnails"]["16_9"]["source"],
-            created_at=datetime.datetime.strptime(item["created_at"], dateformat),
-            updated_at=datetime.datetime.strptime(item["updated_at"], dateformat),
+            created_at=_parse_datetime(item["created_at"]),
+            updated_at=_parse_datetime(item["updated_at"]),
         )
 
-    def __parse_series(self, item: dict, *, embedded: bool = False) -> Series:
-        dateformat = "%Y-%m-%dT%H:%M:%S.%fZ" if not embedded else "%Y-%m-%dT%H:%M:%SZ"
-        collection_page = None
-        if embedded:
-            collection_page = item["_links"]["collection_page"]
-        trailer_url = item.get("trailer_url") if embedded else item.get("trailer_video_id")
-        title = item["name"] if embedded else item["title"]
+    def __parse_series_top(self, item: dict) -> Series:
         return Series(
             entity_id=item["id"],
-            collection_page=collection_page,
-            title=title,
+            collection_page=None,
+            title=item["title"],
             slug=item["slug"],
             short_description=item["short_description"],
             description=item["description"],
             seasons=item["seasons_count"],
-            trailer_url=trailer_url,
-            assets=self.__assets_from_item(item, embedded=embedded),
-            created_at=datetime.datetime.strptime(item["created_at"], dateformat),
-            updated_at=datetime.datetime.strptime(item["updated_at"], dateformat),
+            trailer_url=item.get("trailer_video_id"),
+            assets=self.__assets_from_top_item(item),
+            created_at=_parse_datetime(item["created_at"]),
+            updated_at=_parse_datetime(item["updated_at"]),
+        )
+
+    def __parse_series_embedded(self, item: dict) -> Series:
+        return Series(
+            entity_id=item["id"],
+            collection_page=item["_links"]["collection_page"],
+            title=item["name"],
+            slug=item["slug"],
+            short_description=item["short_description"],
+            description=item["description"],
+            seasons=item["seasons_count"],
+            trailer_url=item.get("trailer_url"),
+            assets=self.__assets_from_embedded_item(item),
+            created_at=_parse_datetime(item["created_at"]),
+            updated_at=_parse_datetime(item["updated_at"]),
         )
 
-    _RESERVED_CATEGORIES: ClassVar = [
-        "featured",
-        "continue-watching",
-        "my-list",
-        "new-releases",
-        "trending",
-        "all-series",
-    ]
+    _RESERVED_CATEGORIES: ClassVar = frozenset(
+        {
+            "featured",
+            "continue-watching",
+            "my-list",
+            "new-releases",
+            "trending",
+            "all-series",
+        }
+    )
 
     def __parse_collection(self, item: dict, *, embedded: bool = False, extended: bool = False) -> Collection:
-        dateformat = "%Y-%m-%dT%H:%M:%S.%fZ" if not embedded else "%Y-%m-%dT%H:%M:%SZ"
         slug = item["slug"]
         if slug in self._RESERVED_CATEGORIES:
             msg = "internal category, skipping"
             raise ValueError(msg)
         iid = item.get("id")
         if iid is None:
-            link_info = re.search(COLLECTION_ID_FINDER, item["_links"]["items"]["href"])
+            link_info = COLLECTION_ID_FINDER.search(item["_links"]["items"]["href"])
             if link_info is None:
                 msg = "could not find id in collection"
                 raise ValueError(msg)
@@ -1075,61 +1355,71 @@ class API:
             thumbnail=assets,
             short_description=item["short_description"] if extended else None,
             description=item["description"] if extended else None,
-            created_at=datetime.datetime.strptime(item["created_at"], dateformat) if extended else None,
-            updated_at=datetime.datetime.strptime(item["updated_at"], dateformat) if extended else None,
+            created_at=_parse_datetime(item["created_at"]) if extended else None,
+            updated_at=_parse_datetime(item["updated_at"]) if extended else None,
         )
 
-    def __embed_for_slug(self, slug: str) -> str:
+    def __embed_for_slug(self, slug: str) -> tuple[str, int | None]:
         res = self.__website_request(f"/videos/{slug}")
-        embed_info = re.search(EMBED_FINDER, res.text)
+        embed_info = EMBED_FINDER.search(res.text)
         if embed_info is None:
             msg = f"could not find embed url for {slug}"
             raise ValueError(msg)
-        return html.unescape(embed_info.group(1))
+        embed_id = embed_info.group(2)
+        return _unescape(embed_info.group(1)), int(embed_id) if embed_id is not None else None
 
     def __config_from_embed(self, url: str) -> dict:
-        embed_page = requests.get(
+        embed_page = self.__embed_session.get(
             url,
             headers={
                 "Referer": self.REFERER_URL,
             },
             timeout=REQUEST_TIMEOUT_S,
         )
-        config_info = re.search(CONFIG_FINDER, embed_page.text)
+        config_info = CONFIG_FINDER.search(embed_page.text)
         if config_info is None:
             msg = f"could not find config url in {url} ({embed_page}/{embed_page.text})"
             raise ValueError(msg)
-        config_url = json.loads(config_info.group(1))["config_url"]
-        return requests.get(config_url, timeout=REQUEST_TIMEOUT_S).json()
+        config_url = _json_loads(config_info.group(1))["config_url"]
+        return _json_loads(self.__embed_session.get(config_url, timeout=REQUEST_TIMEOUT_S).content)
 
     def playable_from_id(self, pid: int) -> tuple[Playable, VideoData]:
         video_res = self.__get_video_by_id(pid)
-        embed = self.__embed_for_slug(video_res["url"])
+        embed, _ = self.__embed_for_slug(video_res["url"])
         return self.__playable_from_id(pid, embed, video_res)
 
     def playable_from_slug(self, slug: str) -> tuple[Playable, VideoData]:
-        embed = self.__embed_for_slug(slug)
-        id_info = re.search(EMBED_ID_FINDER, embed)
-        if id_info is None:
-            msg = f"could not find id in {embed}"
-            raise ValueError(msg)
-        pid = int(id_info.group(1))
+        embed, pid = self.__embed_for_slug(slug)
+        if pid is None:
+            id_info = EMBED_ID_FINDER.search(embed)
+            if id_info is None:
+                msg = f"could not find id in {embed}"
+                raise ValueError(msg)
+            pid = int(id_info.group(1))
         log_message(f"video {pid} from {slug}", level=LOGDEBUG)
         return self.__playable_from_id(pid, embed)
 
     def __get_video_by_id(self, vid: int) -> dict:
+        video_res = self.__video_cache.get(vid)
+        if video_res is not None:
+            return video_res
         video_res = self.__api_request(f"/videos/{vid}", use_tv=True)
         if video_res is None:
             msg = f"could not find video {vid}"
             raise ValueError(msg)
-        log_message(f"video {vid}: {video_res}", level=LOGDEBUG)
+        log_message(lambda: f"video {vid}: {video_res}", level=LOGDEBUG)
+        self.__video_cache[vid] = video_res
         return video_res
 
     def __playable_from_id(self, pid: int, embed: str, video_res: dict | None = None) -> tuple[Playable, VideoData]:
-        config = self.__config_from_embed(embed)
-        log_message(f"config for {pid}: {config}", level=LOGDEBUG)
-        if video_res is None:
-            video_res = self.__get_video_by_id(pid)
+        # the embed config (2 round-trips) doesn't depend on the API calls below, overlap them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            config_future = executor.submit(self.__config_from_embed, embed)
+            if video_res is None:
+                video_res = self.__get_video_by_id(pid)
+            playable = self.__parse_playable(video_res, embedded=True)
+            config = config_future.result()
+        log_message(lambda: f"config for {pid}: {config}", level=LOGDEBUG)
 
         subtitles_raw = video_res.get("tracks", {}).get("subtitles", [])
         subtitles = []
@@ -1140,7 +1430,6 @@ class API:
                 if fmt_data is None:
                     continue
                 subtitles.append(fmt_data["href"])
-        playable = self.__parse_playable(video_res, embedded=True)
         formats = config.get("request", {}).get("files", {})
         if "dash" in formats and False:  # noqa: SIM223
             # Kodi supports it but the format sent back is some homebrew JSON instead of a MPD file
@@ -1186,11 +1475,23 @@ art_dimensions = {
 }
 
 
-def thumbnail_formatter(src: str, *, art: str, blurred: bool = False) -> str:
+def _thumbnail_suffix(art: str, *, blurred: bool) -> str:
     args = {}
     if blurred:
         args["blur"] = 180
     if art in art_dimensions:
         args["w"], args["h"] = art_dimensions[art]
         args["fit"] = "crop"
-    return f"{src}?{urlencode(args)}"
+    return f"?{urlencode(args)}"
+
+
+_THUMBNAIL_SUFFIXES = {
+    (art, blurred): _thumbnail_suffix(art, blurred=blurred) for art in art_dimensions for blurred in (False, True)
+}
+
+
+def thumbnail_formatter(src: str, *, art: str, blurred: bool = False) -> str:
+    suffix = _THUMBNAIL_SUFFIXES.get((art, blurred))
+    if suffix is None:
+        suffix = _thumbnail_suffix(art, blurred=blurred)
+    return f"{src}{suffix}"
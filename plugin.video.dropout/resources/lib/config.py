@@ -1,10 +1,25 @@
 import datetime
 import json
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data).encode()
+
+
+@dataclass(slots=True)
 class PlayState:
     completed: bool
     duration_s: int
@@ -13,13 +28,44 @@ class PlayState:
     from_us: bool = False
 
 
-@dataclass
+class PlayStates(Mapping[int, PlayState]):
+    """Read-only view of the playstate file, each PlayState is only built when looked up."""
+
+    def __init__(self, raw: dict[str, dict]) -> None:
+        self.__raw = raw
+        self.__parsed: dict[int, PlayState] = {}
+
+    def __getitem__(self, video_id: int) -> PlayState:
+        playstate = self.__parsed.get(video_id)
+        if playstate is None:
+            data = self.__raw[str(video_id)]
+            playstate = PlayState(
+                completed=data["completed"],
+                duration_s=data["duration_s"],
+                timecode=data["timecode"],
+                last_seen=datetime.datetime.fromisoformat(data["last_seen"]),
+                from_us=True,
+            )
+            self.__parsed[video_id] = playstate
+        return playstate
+
+    def __contains__(self, video_id: object) -> bool:
+        return str(video_id) in self.__raw
+
+    def __iter__(self) -> Iterator[int]:
+        return (int(k) for k in self.__raw)
+
+    def __len__(self) -> int:
+        return len(self.__raw)
+
+
+@dataclass(slots=True)
 class Search:
     search: str
     first: datetime.datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Credentials:
     hash: str
     token: str
@@ -32,11 +78,23 @@ class Config:
     _CREDENTIALS_FILE = "credentials.json"
     _PLAYSTATE_FILE = "playstate.json"
     _SEARCHES_FILE = "searches.json"
+    _TITLES_FILE = "titles.json"
+    _PREFETCH_FILE = "prefetch.json"
+    _RESPONSES_FILE = "responses.json"
 
     _MAX_SEARCHES = 15
+    _TITLE_TTL = datetime.timedelta(hours=1)
+    _PREFETCH_TTL = datetime.timedelta(minutes=5)
+    _RESPONSE_TTL = datetime.timedelta(minutes=2)
 
     def __init__(self, path: str) -> None:
         self.__path = Path(path)
+        # file -> (stat signature, parsed content), the signature detects writes from the other addon process
+        self.__cache: dict[str, tuple[tuple[int, int], dict]] = {}
+        # (raw playstate file content, view over it), rebuilt whenever the raw content is replaced
+        self.__playstate_map: tuple[dict, PlayStates] | None = None
+        # listings fetch pages from worker threads, read-modify-write of a file must not interleave
+        self.__lock = threading.RLock()
 
     def get_cookie_jar(self) -> dict:
         return self.__read_json_file(self._COOKIEJAR_FILE, dfault={})
@@ -45,30 +103,19 @@ class Config:
         self.__write_json_file(self._COOKIEJAR_FILE, cookiejar)
 
     def get_playstates(self) -> dict[int, PlayState]:
+        return dict(self.get_playstate_map())
+
+    def get_playstate_map(self) -> PlayStates:
+        # shared snapshot (use get_playstates for a private copy)
         playstates = self.__read_json_file(self._PLAYSTATE_FILE, dfault={})
-        return {
-            int(k): PlayState(
-                completed=v["completed"],
-                duration_s=v["duration_s"],
-                timecode=v["timecode"],
-                last_seen=datetime.datetime.fromisoformat(v["last_seen"]),
-                from_us=True,
-            )
-            for k, v in playstates.items()
-        }
+        if self.__playstate_map is not None and self.__playstate_map[0] is playstates:
+            return self.__playstate_map[1]
+        mapping = PlayStates(playstates)
+        self.__playstate_map = (playstates, mapping)
+        return mapping
 
     def get_playstate(self, video_id: int) -> PlayState | None:
-        playstates = self.__read_json_file(self._PLAYSTATE_FILE, dfault={})
-        if str(video_id) not in playstates:
-            return None
-        data = playstates[str(video_id)]
-        return PlayState(
-            completed=data["completed"],
-            duration_s=data["duration_s"],
-            timecode=data["timecode"],
-            last_seen=datetime.datetime.fromisoformat(data["last_seen"]),
-            from_us=True,
-        )
+        return self.get_playstate_map().get(video_id)
 
     def set_playstate(self, video_id: int, playstate: PlayState) -> None:
         playstate_data = {
@@ -77,9 +124,12 @@ class Config:
             "timecode": playstate.timecode,
             "last_seen": playstate.last_seen.isoformat(),
         }
-        current_playstate = self.__read_json_file(self._PLAYSTATE_FILE, dfault={})
-        current_playstate[str(video_id)] = playstate_data
-        self.__write_json_file(self._PLAYSTATE_FILE, current_playstate)
+        with self.__lock:
+            # the read result is the cached content itself, only the successful write may replace it
+            current_playstate = dict(self.__read_json_file(self._PLAYSTATE_FILE, dfault={}))
+            current_playstate[str(video_id)] = playstate_data
+            self.__playstate_map = None
+            self.__write_json_file(self._PLAYSTATE_FILE, current_playstate)
 
     def get_searches(self) -> list[Search]:
         searches = self.__read_json_file(self._SEARCHES_FILE, dfault={})
@@ -93,24 +143,25 @@ class Config:
         ]
 
     def add_search(self, search: str) -> None:
-        searches = self.__read_json_file(self._SEARCHES_FILE, dfault={})
-        searches["searches"] = searches.get("searches", [])
-        if search not in searches["searches"]:
-            searches["searches"].append(
-                {
-                    "search": search,
-                    "first": datetime.datetime.now(tz=datetime.UTC).isoformat(),
-                }
-            )
-            if len(searches["searches"]) > self._MAX_SEARCHES:
-                searches["searches"].pop(0)
-        self.__write_json_file(self._SEARCHES_FILE, searches)
+        with self.__lock:
+            searches = dict(self.__read_json_file(self._SEARCHES_FILE, dfault={}))
+            # bounded FIFO, appending past _MAX_SEARCHES drops the oldest entry
+            saved = deque(searches.get("searches", []), maxlen=self._MAX_SEARCHES)
+            if search not in {s["search"] for s in saved}:
+                saved.append(
+                    {
+                        "search": search,
+                        "first": datetime.datetime.now(tz=datetime.UTC).isoformat(),
+                    }
+                )
+            searches["searches"] = list(saved)
+            self.__write_json_file(self._SEARCHES_FILE, searches)
 
     def remove_search(self, search: str) -> None:
-        searches = self.__read_json_file(self._SEARCHES_FILE, dfault={})
-        searches["searches"] = searches.get("searches", [])
-        searches["searches"] = list(filter(lambda s: s["search"] != search, searches["searches"]))
-        self.__write_json_file(self._SEARCHES_FILE, searches)
+        with self.__lock:
+            searches = dict(self.__read_json_file(self._SEARCHES_FILE, dfault={}))
+            searches["searches"] = [s for s in searches.get("searches", []) if s["search"] != search]
+            self.__write_json_file(self._SEARCHES_FILE, searches)
 
     def get_credentials(self) -> Credentials | None:
         credentials = self.__read_json_file(self._CREDENTIALS_FILE, dfault={})
@@ -126,6 +177,7 @@ class Config:
     def set_credentials(self, credentials: Credentials | None) -> None:
         if credentials is None:
             self.__get_path(self._CREDENTIALS_FILE).unlink()
+            self.__cache.pop(self._CREDENTIALS_FILE, None)
             return
         credentials_data = {
             "hash": credentials.hash,
@@ -135,20 +187,121 @@ class Config:
         }
         self.__write_json_file(self._CREDENTIALS_FILE, credentials_data)
 
+    def get_title(self, kind: str, entity_id: int) -> str | None:
+        titles = self.__read_json_file(self._TITLES_FILE, dfault={})
+        entry = titles.get(f"{kind}:{entity_id}")
+        if entry is None:
+            return None
+        if datetime.datetime.now(tz=datetime.UTC) - datetime.datetime.fromisoformat(entry["when"]) > self._TITLE_TTL:
+            return None
+        return entry["title"]
+
+    def set_title(self, kind: str, entity_id: int, title: str) -> None:
+        with self.__lock:
+            now = datetime.datetime.now(tz=datetime.UTC)
+            titles = {
+                k: v
+                for k, v in self.__read_json_file(self._TITLES_FILE, dfault={}).items()
+                if now - datetime.datetime.fromisoformat(v["when"]) <= self._TITLE_TTL
+            }
+            titles[f"{kind}:{entity_id}"] = {"title": title, "when": now.isoformat()}
+            self.__write_json_file(self._TITLES_FILE, titles)
+
+    def clear_titles(self) -> None:
+        self.__write_json_file(self._TITLES_FILE, {})
+
+    def pop_prefetched(self, key: str) -> dict | None:
+        with self.__lock:
+            prefetched = dict(self.__read_json_file(self._PREFETCH_FILE, dfault={}))
+            entry = prefetched.pop(key, None)
+            if entry is None:
+                return None
+            self.__write_json_file(self._PREFETCH_FILE, prefetched)
+        if datetime.datetime.now(tz=datetime.UTC) - datetime.datetime.fromisoformat(entry["when"]) > self._PREFETCH_TTL:
+            return None
+        return entry["data"]
+
+    def set_prefetched(self, key: str, data: dict) -> None:
+        with self.__lock:
+            now = datetime.datetime.now(tz=datetime.UTC)
+            prefetched = {
+                k: v
+                for k, v in self.__read_json_file(self._PREFETCH_FILE, dfault={}).items()
+                if now - datetime.datetime.fromisoformat(v["when"]) <= self._PREFETCH_TTL
+            }
+            prefetched[key] = {"data": data, "when": now.isoformat()}
+            self.__write_json_file(self._PREFETCH_FILE, prefetched)
+
+    def clear_prefetched(self) -> None:
+        self.__write_json_file(self._PREFETCH_FILE, {})
+
+    def get_cached_response(self, key: str) -> dict | None:
+        responses = self.__read_json_file(self._RESPONSES_FILE, dfault={})
+        entry = responses.get(key)
+        if entry is None:
+            return None
+        if datetime.datetime.now(tz=datetime.UTC) - datetime.datetime.fromisoformat(entry["when"]) > self._RESPONSE_TTL:
+            return None
+        return entry["data"]
+
+    def set_cached_response(self, key: str, data: dict) -> None:
+        with self.__lock:
+            now = datetime.datetime.now(tz=datetime.UTC)
+            responses = {
+                k: v
+                for k, v in self.__read_json_file(self._RESPONSES_FILE, dfault={}).items()
+                if now - datetime.datetime.fromisoformat(v["when"]) <= self._RESPONSE_TTL
+            }
+            responses[key] = {"data": data, "when": now.isoformat()}
+            self.__write_json_file(self._RESPONSES_FILE, responses)
+
+    def clear_cached_responses(self) -> None:
+        self.__write_json_file(self._RESPONSES_FILE, {})
+
     def __get_path(self, file: str) -> Path:
         return self.__path / file
 
     def __read_json_file(self, file: str, dfault: dict) -> dict:
         path = self.__get_path(file)
 
-        if not path.exists():
+        try:
+            signature = self.__signature(path)
+        except FileNotFoundError:
             return dfault
 
-        with path.open() as f:
-            return json.load(f)
+        cached = self.__cache.get(file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with path.open("rb") as f:
+                data = _json_loads(f.read())
+        except ValueError:
+            # a damaged file (e.g. from a version without atomic writes) reads as empty instead of failing every call
+            return dfault
+        self.__cache[file] = (signature, data)
+        return data
 
     def __write_json_file(self, file: str, data: dict) -> None:
         path = self.__get_path(file)
 
-        with path.open("w") as f:
-            json.dump(data, f)
+        # write next to the target then swap it in, so a killed Kodi never leaves a truncated file behind;
+        # the temporary file is unique as other threads or plugin invocations may be writing the same file
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as f:
+            tmp = Path(f.name)
+            try:
+                f.write(_json_dumps(data))
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+        try:
+            tmp.replace(path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self.__cache[file] = (self.__signature(path), data)
+
+    @staticmethod
+    def __signature(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
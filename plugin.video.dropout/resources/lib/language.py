@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from .addon import Addon
 from .utils import LOGWARNING, log_message
 
@@ -35,12 +37,19 @@ class Language:
     REMOVE_SEARCH = 32133
     GO_TO_SEASON = 32134
 
+    # strings don't change during a plugin invocation, only ask Kodi once per id
+    _STRINGS: ClassVar[dict[int, str]] = {}
+
     @classmethod
     def __call__(cls, uid: int) -> str:
-        text = Addon.XBMC.getLocalizedString(uid)
+        text = cls._STRINGS.get(uid)
+        if text is not None:
+            return text
+        text = Addon.xbmc().getLocalizedString(uid)
         if text == "":
             log_message(f"missing string {uid}", level=LOGWARNING)
             text = f"missing string {uid}"
+        cls._STRINGS[uid] = text
         return text
 
 
@@ -10,14 +10,24 @@ from .utils import log_exception, log_message
 if TYPE_CHECKING:
     import xbmcgui
 
+PLAY_STATE_MIN_DELTA_S = 5
+
+
+class SettingsMonitor(xbmc.Monitor):
+    # @override
+    def onSettingsChanged(self) -> None:  # noqa: N802
+        Addon.invalidate()
+        log_message("Settings changed")
+
 
 class MonitorPlayer(xbmc.Player):
     def __init__(self) -> None:
         super().__init__()
-        self.monitor = xbmc.Monitor()
+        self.monitor = SettingsMonitor()
         self.playing = None
+        self.__last_written_pos: int | None = None
 
-    def __update_play_state(self, *, completed: bool = False) -> None:
+    def __update_play_state(self, *, completed: bool = False, force: bool = False) -> None:
         if self.playing is None:
             return
         try:
@@ -25,13 +35,20 @@ class MonitorPlayer(xbmc.Player):
         except RuntimeError:
             log_exception("Error getting playback time")
             pos = 0
+        if (
+            not force
+            and self.__last_written_pos is not None
+            and abs(pos - self.__last_written_pos) < PLAY_STATE_MIN_DELTA_S
+        ):
+            return
         ps = PlayState(
             completed=completed,
             timecode=0,
             duration_s=pos,
             last_seen=datetime.datetime.now(tz=datetime.UTC),
         )
-        Addon.CONFIG.set_playstate(self.playing, ps)
+        Addon.config().set_playstate(self.playing, ps)
+        self.__last_written_pos = pos
         log_message(f"Updated play state for video {self.playing}: {ps}")
 
     # @override
@@ -42,22 +59,23 @@ class MonitorPlayer(xbmc.Player):
             log_message("No video ID found, cannot update play state")
             return
         self.playing = int(video_id)
+        self.__last_written_pos = None
         log_message(f"Playback started: {self.playing}")
 
     # @override
     def onPlayBackPaused(self) -> None:  # noqa: N802
-        self.__update_play_state()
+        self.__update_play_state(force=True)
         log_message("Playback paused")
 
     # @override
     def onPlayBackStopped(self) -> None:  # noqa: N802
-        self.__update_play_state()
+        self.__update_play_state(force=True)
         self.playing = None
         log_message("Playback stopped")
 
     # @override
     def onPlayBackEnded(self) -> None:  # noqa: N802
-        self.__update_play_state(completed=True)
+        self.__update_play_state(completed=True, force=True)
         self.playing = None
         log_message("Playback ended")
 
@@ -1,19 +1,13 @@
-# ruff: noqa: E402
-
-from .patch import monkey_patch
-
-monkey_patch()
-
 import sys
-
-import xbmc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from .addon import Addon
-from .api import API
+from .api import API, PaginatedMedia
 from .language import _
 from .router import Router
 from .settings import Settings
-from .ui import Dialog, Folder, TextDialog, notify, play_video, refresh, render_page
+from .ui import Dialog, Folder, TextDialog, notify, play_video, refresh, render_page, run_plugin
 from .utils import log_message
 
 router = Router(default_action="home")
@@ -53,12 +47,12 @@ def home(*, sttngs: Settings, api: API) -> Folder:  # noqa: ARG001
     return folder
 
 
-@router.route
-def login(*, sttngs: Settings, api: API) -> Dialog:
+@router.route(needs_api=False)
+def login(*, sttngs: Settings) -> Dialog:
     return Dialog(
         title=_.LOGIN_TITLE,
         message=_.LOGIN_MESSAGE,
-        on_ok=lambda: settings(sttngs=sttngs, api=api),
+        on_ok=lambda: settings(sttngs=sttngs),
     )
 
 
@@ -69,6 +63,7 @@ def featured(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # noqa:
         action="featured",
         title=_.FEATURED,
         page=api.get_featured(page=int(page)),
+        prefetch=api.prefetch,
     )
 
 
@@ -85,7 +80,13 @@ def continue_watching(*, sttngs: Settings, api: API, page: str = "1") -> Folder:
 
 @router.route
 def my_list(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # noqa: ARG001
-    return render_page(router, action="my_list", title=_.MY_LIST, page=api.get_my_list(page=int(page)))
+    return render_page(
+        router,
+        action="my_list",
+        title=_.MY_LIST,
+        page=api.get_my_list(page=int(page)),
+        prefetch=api.prefetch,
+    )
 
 
 @router.route
@@ -95,6 +96,7 @@ def new_releases(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # n
         action="new_releases",
         title=_.NEW_RELEASES,
         page=api.get_new_releases(page=int(page)),
+        prefetch=api.prefetch,
         content="episodes",
     )
 
@@ -107,6 +109,7 @@ def trending(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # noqa:
         content="tvshows",
         title=_.TRENDING,
         page=api.get_trending(page=int(page)),
+        prefetch=api.prefetch,
     )
 
 
@@ -118,16 +121,23 @@ def series(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # noqa: A
         content="tvshows",
         title=_.SERIES,
         page=api.get_all_series(page=int(page)),
+        prefetch=api.prefetch,
     )
 
 
 @router.route
 def browse(*, sttngs: Settings, api: API, page: str = "1") -> Folder:  # noqa: ARG001
-    return render_page(router, action="browse", title=_.BROWSE, page=api.get_browse(page=int(page)))
+    return render_page(
+        router,
+        action="browse",
+        title=_.BROWSE,
+        page=api.get_browse(page=int(page)),
+        prefetch=api.prefetch,
+    )
 
 
-@router.route
-def search(*, sttngs: Settings, api: API) -> Folder:  # noqa: ARG001
+@router.route(needs_api=False)
+def search(*, sttngs: Settings) -> Folder:  # noqa: ARG001
     folder = Folder(_.SEARCH)
     folder.add_folder(
         router=router,
@@ -135,7 +145,7 @@ def search(*, sttngs: Settings, api: API) -> Folder:  # noqa: ARG001
         path=router.url_for(new_search),
         special_sort="top",
     )
-    searches = Addon.CONFIG.get_searches()
+    searches = Addon.config().get_searches()
     searches = sorted(searches, key=lambda s: s.first, reverse=True)
     for search in searches:
         log_message(f"Adding search: {search}")
@@ -153,17 +163,17 @@ def search(*, sttngs: Settings, api: API) -> Folder:  # noqa: ARG001
     return folder
 
 
-@router.route
-def remove_search(*, sttngs: Settings, api: API, search: str) -> None:  # noqa: ARG001
-    Addon.CONFIG.remove_search(search)
+@router.route(needs_api=False)
+def remove_search(*, sttngs: Settings, search: str) -> None:  # noqa: ARG001
+    Addon.config().remove_search(search)
     return refresh()
 
 
-@router.route
-def new_search(*, sttngs: Settings, api: API) -> TextDialog:  # noqa: ARG001
+@router.route(needs_api=False)
+def new_search(*, sttngs: Settings) -> TextDialog:  # noqa: ARG001
     def on_ok(search: str) -> None:
-        Addon.CONFIG.add_search(search)
-        xbmc.executebuiltin(f"RunPlugin({router.url_for(search_results, search=search)})")
+        Addon.config().add_search(search)
+        run_plugin(router.url_for(search_results, search=search))
 
     return TextDialog(
         title=_.SEARCH,
@@ -178,6 +188,7 @@ def search_results(*, sttngs: Settings, api: API, search: str, page: str = "1")
         action="search_results",
         title=_(_.SEARCH_RESULTS_FOR).format(query=search),
         page=api.search(query=search, page=int(page)),
+        prefetch=api.prefetch,
         extra={"search": search},
     )
 
@@ -196,9 +207,29 @@ def logout(*, sttngs: Settings, api: API) -> Dialog:  # noqa: ARG001
     )
 
 
-@router.route
-def settings(*, sttngs: Settings, api: API) -> None:  # noqa: ARG001
-    return Addon.XBMC.openSettings()
+@router.route(needs_api=False)
+def settings(*, sttngs: Settings) -> None:  # noqa: ARG001
+    return Addon.xbmc().openSettings()
+
+
+def _title_and_items(
+    api: API,
+    kind: str,
+    entity_id: int,
+    fetch_title: Callable[[int], str],
+    *,
+    page: int,
+) -> tuple[str, PaginatedMedia]:
+    title = Addon.config().get_title(kind, entity_id)
+    if title is not None:
+        return title, api.get_collection_items(collection=entity_id, page=page)
+    # the metadata and the items are independent calls, overlap them
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        title_future = executor.submit(fetch_title, entity_id)
+        items = api.get_collection_items(collection=entity_id, page=page)
+        title = title_future.result()
+    Addon.config().set_title(kind, entity_id, title)
+    return title, items
 
 
 @router.route
@@ -210,12 +241,13 @@ def show_collection(
     page: str = "1",
 ) -> Folder:
     cid = int(collection_id)
-    collection = api.get_collection(cid)
+    title, items = _title_and_items(api, "collection", cid, lambda i: api.get_collection(i).name, page=int(page))
     return render_page(
         router,
         action="show_collection",
-        title=collection.name,
-        page=api.get_collection_items(collection=cid, page=int(page)),
+        title=title,
+        page=items,
+        prefetch=api.prefetch,
         extra={"collection_id": collection_id},
     )
 
@@ -223,12 +255,13 @@ def show_collection(
 @router.route
 def show_series(*, sttngs: Settings, api: API, entity_id: str, page: str = "1") -> Folder:  # noqa: ARG001
     sid = int(entity_id)
-    series = api.get_series(sid)
+    title, items = _title_and_items(api, "series", sid, lambda i: api.get_series(i).title, page=int(page))
     return render_page(
         router,
         action="show_series",
-        title=series.title,
-        page=api.get_collection_items(collection=sid, page=int(page)),
+        title=title,
+        page=items,
+        prefetch=api.prefetch,
         extra={"entity_id": entity_id},
     )
 
@@ -236,12 +269,13 @@ def show_series(*, sttngs: Settings, api: API, entity_id: str, page: str = "1")
 @router.route
 def show_season(*, sttngs: Settings, api: API, entity_id: str, page: str = "1") -> Folder:  # noqa: ARG001
     sid = int(entity_id)
-    season = api.get_season(sid)
+    title, items = _title_and_items(api, "season", sid, lambda i: api.get_season(i).title, page=int(page))
     return render_page(
         router,
         action="show_season",
-        title=season.title,
-        page=api.get_collection_items(collection=sid, page=int(page)),
+        title=title,
+        page=items,
+        prefetch=api.prefetch,
         extra={"entity_id": entity_id},
         content="episodes",
     )
@@ -1,6 +1,6 @@
 from collections.abc import Callable
 from typing import Any
-from urllib.parse import parse_qsl, urlencode
+from urllib.parse import parse_qsl, quote_plus, urlencode
 
 from .addon import Addon
 from .api import API
@@ -10,30 +10,53 @@ from .utils import log_message
 class Router:
     def __init__(self, *, default_action: str) -> None:
         self.__routes: dict[str, Callable] = {}
+        self.__without_api: set[str] = set()
+        # URLs only depend on the action and its arguments, many are repeated on every row of a page
+        self.__urls: dict[tuple[str, tuple[tuple[str, Any], ...]], str] = {}
+        self.__url_templates: dict[tuple[str, tuple[str, ...], bool], Callable[..., str]] = {}
         self.__default_action = default_action
         self.__settings = Addon.settings()
-        self.__api = API(credentials=Addon.credentials())
+        # built on first use: logging in may hit the network, routes like settings or search don't need it
+        self.__api: API | None = None
 
-    def route(self, fn: Callable) -> Callable:
-        name = fn.__name__  # ty:ignore[unresolved-attribute]
-        if name in self.__routes:
-            msg = f"duplicate action name: {name}"
-            raise ValueError(msg)
-        self.__routes[name] = fn
-        return fn
+    def route(self, fn: Callable | None = None, *, needs_api: bool = True) -> Callable:
+        def register(fn: Callable) -> Callable:
+            name = fn.__name__  # ty:ignore[unresolved-attribute]
+            if name in self.__routes:
+                msg = f"duplicate action name: {name}"
+                raise ValueError(msg)
+            self.__routes[name] = fn
+            if not needs_api:
+                self.__without_api.add(name)
+            return fn
 
-    def dispatch(self, path: str) -> None:
-        params = dict(parse_qsl(path))
+        if fn is None:
+            return register
+        return register(fn)
 
-        all_params = {**params, "api": self.__api, "sttngs": self.__settings}
-        all_params.pop("action", None)
+    def __get_api(self) -> API:
+        if self.__api is None:
+            self.__api = API(credentials=Addon.credentials())
+        return self.__api
 
-        name = params.get("action", self.__default_action)
+    def dispatch(self, path: str) -> None:
+        name = self.__default_action
+        all_params: dict[str, Any] = {}
+        # the root entry (Kodi's first call) has no query at all
+        if path:
+            for key, value in parse_qsl(path):
+                if key == "action":
+                    name = value
+                else:
+                    all_params[key] = value
+        if name not in self.__without_api:
+            all_params["api"] = self.__get_api()
+        all_params["sttngs"] = self.__settings
         log_message(f"dispatching: {path} to {name}")
 
         action = self.__routes.get(name)
         if action is None:
-            msg = f"Unsupported action {params['action']}"
+            msg = f"Unsupported action {name}"
             raise ValueError(msg)
 
         res = action(**all_params)
@@ -42,8 +65,45 @@ class Router:
 
     def url_for(self, fn_or_action: Callable | str, **kwargs: Any) -> str:
         action = fn_or_action if isinstance(fn_or_action, str) else fn_or_action.__name__  # ty:ignore[unresolved-attribute]
+        key = (action, tuple(kwargs.items()))
+        url = self.__urls.get(key)
+        if url is not None:
+            return url
         if action not in self.__routes:
             msg = f"Unsupported action {action}"
             raise ValueError(msg)
         qs = urlencode({**kwargs, "action": action})
-        return f"plugin://{Addon.ID}?{qs}"
+        url = f"plugin://{Addon.ID}?{qs}"
+        self.__urls[key] = url
+        return url
+
+    def url_template(
+        self,
+        fn_or_action: Callable | str,
+        *params: str,
+        run_plugin: bool = False,
+    ) -> Callable[..., str]:
+        """Return a builder for per-entity URLs: the query is laid out once, only the values are quoted per call.
+
+        The builder must be called with exactly `params` and yields the same URL as url_for would,
+        wrapped in a RunPlugin() builtin call when `run_plugin` is set (for context menus).
+        """
+        action = fn_or_action if isinstance(fn_or_action, str) else fn_or_action.__name__  # ty:ignore[unresolved-attribute]
+        key = (action, params, run_plugin)
+        builder = self.__url_templates.get(key)
+        if builder is not None:
+            return builder
+        if action not in self.__routes:
+            msg = f"Unsupported action {action}"
+            raise ValueError(msg)
+        query = "&".join([*(f"{quote_plus(p)}={{{p}}}" for p in params), urlencode({"action": action})])
+        template = f"plugin://{Addon.ID}?{query}"
+        if run_plugin:
+            template = f"RunPlugin({template})"
+
+        def builder(**kwargs: Any) -> str:
+            # ids are ints, which never need quoting
+            return template.format_map({k: v if isinstance(v, int) else quote_plus(str(v)) for k, v in kwargs.items()})
+
+        self.__url_templates[key] = builder
+        return builder
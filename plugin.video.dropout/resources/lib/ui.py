@@ -1,3 +1,5 @@
+import datetime
+import functools
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -13,6 +15,7 @@ from .api import (
     Movie,
     PaginatedMedia,
     Playable,
+    ReleasedVideo,
     Season,
     Series,
     UnreleasedVideo,
@@ -26,21 +29,48 @@ from .utils import LOGWARNING, log_message
 
 KODI_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+_THUMBNAIL_ARTS = ("poster", "fanart", "banner", "thumb", "landscape")
+
+
+@functools.lru_cache(maxsize=2048)
+def _kodi_datetime(value: datetime.date) -> str:
+    # episodes of a season often share release/creation dates
+    return value.strftime(KODI_DATETIME_FORMAT)
+
+
+@functools.cache
+def _folder_arts() -> dict[str, str]:
+    path = Path(Addon.path())
+    icon = str(path / "icon.png")
+    fanart = str(path / "fanart.png")
+    poster = str(path / "poster.png")
+    return {
+        "icon": icon,
+        "thumb": fanart,
+        "fanart": fanart,
+        "landscape": fanart,
+        "poster": poster,
+    }
+
 
 class Folder:
+    __slots__ = ("__after_render", "__handle", "__items")
+
     def __init__(
         self,
         name: int | str,
         *,
         content: str = "episodes",
-        total_items: int | None = None,
     ) -> None:
         self.__handle = Addon.handle()
-        self.__total_items = total_items
+        # entries are handed to Kodi in one addDirectoryItems call on render
+        self.__items: list[tuple[str, xbmcgui.ListItem, bool]] = []
+        self.__after_render: Callable[[], None] | None = None
         xbmcplugin.setPluginCategory(self.__handle, _(name) if isinstance(name, int) else name)
         xbmcplugin.setContent(self.__handle, content)
 
     @classmethod
+    @functools.cache
     def __get_settings_menu(cls, router: Router) -> tuple[str, str]:
         return (
             _(_.SETTINGS),
@@ -62,15 +92,7 @@ class Folder:
         list_item.setProperty("IsPlayable", "false")
         if special_sort is not None:
             list_item.setProperty("SpecialSort", special_sort)
-        list_item.setArt(
-            {
-                "icon": str(Path(Addon.PATH) / "icon.png"),
-                "thumb": str(Path(Addon.PATH) / "fanart.png"),
-                "fanart": str(Path(Addon.PATH) / "fanart.png"),
-                "landscape": str(Path(Addon.PATH) / "fanart.png"),
-                "poster": str(Path(Addon.PATH) / "poster.png"),
-            }
-        )
+        list_item.setArt(_folder_arts())
         list_item.addContextMenuItems(
             [
                 *(contexts if contexts is not None else []),
@@ -78,32 +100,26 @@ class Folder:
             ],
             replaceItems=True,
         )
-        xbmcplugin.addDirectoryItem(self.__handle, path, list_item, True)  # noqa: FBT003
+        self.__items.append((path, list_item, True))
 
     @classmethod
     def __assets_to_arts(cls, assets: Assets) -> dict[str, str]:
-        arts: dict[str, str | None] = {
-            "icon": assets.icon,
-            "poster": assets.poster,
-            "fanart": assets.fanart,
-            "banner": assets.banner,
-            "thumb": assets.thumb,
-            "landscape": assets.landscape,
+        return {
+            k: thumbnail_formatter(v, art=k)
+            for k, v in (
+                ("icon", assets.icon),
+                ("poster", assets.poster),
+                ("fanart", assets.fanart),
+                ("banner", assets.banner),
+                ("thumb", assets.thumb),
+                ("landscape", assets.landscape),
+            )
+            if v is not None
         }
-        arts: dict[str, str] = {k: v for k, v in arts.items() if v is not None}
-        for k, v in arts.items():
-            arts[k] = thumbnail_formatter(v, art=k)
-        return arts
 
     @classmethod
     def __thumbnail_to_arts(cls, thumbnail: str) -> dict[str, str]:
-        return {
-            "poster": thumbnail_formatter(thumbnail, art="poster"),
-            "fanart": thumbnail_formatter(thumbnail, art="fanart"),
-            "banner": thumbnail_formatter(thumbnail, art="banner"),
-            "thumb": thumbnail_formatter(thumbnail, art="thumb"),
-            "landscape": thumbnail_formatter(thumbnail, art="landscape"),
-        }
+        return {k: thumbnail_formatter(thumbnail, art=k) for k in _THUMBNAIL_ARTS}
 
     @classmethod
     def __add_prefix(cls, prefix: str, name: str) -> str:
@@ -120,7 +136,9 @@ class Folder:
         )
         list_item.setProperty(Addon.PLAYER_VIDEO_ID, str(video.entity_id))
         list_item.setProperty("IsPlayable", "true")
-        if isinstance(video, Movie):
+        # Movie has no subclasses: an identity check on the type, no MRO walk (UnreleasedVideo keeps its
+        # isinstance, its else branch relies on the narrowing)
+        if type(video) is Movie:
             list_item.setArt(cls.__assets_to_arts(video.assets))
         else:
             list_item.setArt(cls.__thumbnail_to_arts(video.thumbnail))
@@ -132,16 +150,28 @@ class Folder:
         info_tag.setPlotOutline(video.short_description)
         info_tag.setTagLine(video.short_description)
         info_tag.setPlot(video.description)
-        info_tag.setDateAdded(video.created_at.strftime(KODI_DATETIME_FORMAT))
+        info_tag.setDateAdded(_kodi_datetime(video.created_at))
         info_tag.setDuration(video.duration_s)
 
-        contextmenu = []
-        if isinstance(video, Movie):
+        # the watchlist entry comes first, built upfront rather than inserted at the front later
+        typ = "video" if isinstance(video, Video) else "movie"
+        if video.is_in_list:
+            command = router.url_template("remove_from_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type=typ, entity_id=video.entity_id
+            )
+            contextmenu = [(_(_.REMOVE_FROM_LIST), command)]
+        else:
+            command = router.url_template("add_to_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type=typ, entity_id=video.entity_id
+            )
+            contextmenu = [(_(_.ADD_TO_LIST), command)]
+
+        if type(video) is Movie:
             if video.trailer_url is not None:
                 if isinstance(video.trailer_url, int):
                     path = router.url_for("play", id=video.trailer_url)
                 else:
-                    path = router.url_for("play", slug=Path(video.trailer_url).name)
+                    path = router.url_for("play", slug=video.trailer_url.rstrip("/").rpartition("/")[2])
                 info_tag.setTrailer(path)
             info_tag.setMediaType("movie")
 
@@ -151,7 +181,7 @@ class Folder:
         else:
             info_tag.setTags(video.tags)
             if video.release_dates is not None and len(video.release_dates) > 0:
-                info_tag.setFirstAired(video.release_dates[0].date.strftime(KODI_DATETIME_FORMAT))
+                info_tag.setFirstAired(_kodi_datetime(video.release_dates[0].date))
                 info_tag.setYear(video.release_dates[0].date.year)
                 info_tag.setCountries([video.release_dates[0].location])
 
@@ -168,41 +198,24 @@ class Folder:
                 contextmenu.append(
                     (
                         _(_.GO_TO_SERIES),
-                        f"RunPlugin({router.url_for('show_series', entity_id=video.series.id)})",
+                        router.url_template("show_series", "entity_id", run_plugin=True)(entity_id=video.series.id),
                     )
                 )
 
             if video.play_state is not None:
                 info_tag.setResumePoint(video.play_state.duration_s, video.duration_s)
-                info_tag.setLastPlayed(video.play_state.last_seen.strftime(KODI_DATETIME_FORMAT))
+                info_tag.setLastPlayed(_kodi_datetime(video.play_state.last_seen))
                 if video.play_state.completed:
                     info_tag.setPlaycount(1)
 
-            if not isinstance(video, Movie):
+            if type(video) is not Movie:
                 contextmenu.append(
                     (
                         _(_.GO_TO_SEASON),
-                        f"RunPlugin({router.url_for('show_season', entity_id=video.collection_id)})",
+                        router.url_template("show_season", "entity_id", run_plugin=True)(entity_id=video.collection_id),
                     )
                 )
 
-        typ = "video" if isinstance(video, Video) else "movie"
-        if video.is_in_list:
-            contextmenu.insert(
-                0,
-                (
-                    _(_.REMOVE_FROM_LIST),
-                    f"RunPlugin({router.url_for('remove_from_list', entity_type=typ, entity_id=video.entity_id)})",
-                ),
-            )
-        else:
-            contextmenu.insert(
-                0,
-                (
-                    _(_.ADD_TO_LIST),
-                    f"RunPlugin({router.url_for('add_to_list', entity_type=typ, entity_id=video.entity_id)})",
-                ),
-            )
         contextmenu.append(cls.__get_settings_menu(router))
         list_item.addContextMenuItems(
             contextmenu,
@@ -217,20 +230,13 @@ class Folder:
         router: Router,
         video: Playable,
     ) -> None:
-        path = router.url_for(
-            "play",
+        path = router.url_template("play", "slug")(
             slug=video.trailer_slug if isinstance(video, UnreleasedVideo) else video.slug,
         )
 
         list_item = self.info_for_playable(router=router, video=video, path=path)
 
-        xbmcplugin.addDirectoryItem(
-            self.__handle,
-            path,
-            list_item,
-            isFolder=False,
-            totalItems=self.__total_items or 0,
-        )
+        self.__items.append((path, list_item, False))
 
     def add_series(
         self,
@@ -238,7 +244,7 @@ class Folder:
         router: Router,
         series: Series,
     ) -> None:
-        path = router.url_for("show_series", entity_id=series.entity_id)
+        path = router.url_template("show_series", "entity_id")(entity_id=series.entity_id)
 
         list_item = xbmcgui.ListItem(
             label=self.__add_prefix("SER", series.title),
@@ -254,47 +260,38 @@ class Folder:
         info_tag.setPlotOutline(series.short_description)
         info_tag.setTagLine(series.short_description)
         info_tag.setPlot(series.description)
-        info_tag.setDateAdded(series.created_at.strftime(KODI_DATETIME_FORMAT))
-        # FIXME: if we set a trailer on a folder, then clicking the folder tries (and fails) to play the trailer
-        if series.trailer_url is not None and False:  # noqa: SIM223
-            path = None
-            if isinstance(series.trailer_url, int):
-                path = router.url_for("play", id=series.trailer_url)
-            else:
-                path = router.url_for("play", slug=Path(series.trailer_url).name)
-            info_tag.setTrailer(path)
+        info_tag.setDateAdded(_kodi_datetime(series.created_at))
+        # FIXME: no trailer on folders, clicking the folder would try (and fail) to play it instead of opening it
         info_tag.setMediaType("tvshow")
-        for i in range(series.seasons):
-            info_tag.addSeason(i + 1)
+        # one call for all the (unnamed) seasons rather than one per season
+        info_tag.addSeasons([(i, "") for i in range(1, series.seasons + 1)])
 
         contextmenu = []
         if series.is_in_list:
-            url = router.url_for("remove_from_list", entity_type="series", entity_id=series.entity_id)
+            command = router.url_template("remove_from_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="series", entity_id=series.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.REMOVE_FROM_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         else:
-            url = router.url_for("add_to_list", entity_type="series", entity_id=series.entity_id)
+            command = router.url_template("add_to_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="series", entity_id=series.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.ADD_TO_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         list_item.addContextMenuItems(
             contextmenu,
             replaceItems=True,
         )
-        xbmcplugin.addDirectoryItem(
-            self.__handle,
-            path,
-            list_item,
-            isFolder=True,
-            totalItems=self.__total_items or 0,
-        )
+        self.__items.append((path, list_item, True))
 
     def add_season(
         self,
@@ -302,7 +299,7 @@ class Folder:
         router: Router,
         season: Season,
     ) -> None:
-        path = router.url_for("show_season", entity_id=season.entity_id)
+        path = router.url_template("show_season", "entity_id")(entity_id=season.entity_id)
 
         list_item = xbmcgui.ListItem(label=self.__add_prefix("SEA", season.title), path=path)
         list_item.setProperty("IsPlayable", "false")
@@ -311,46 +308,37 @@ class Folder:
 
         info_tag: xbmc.InfoTagVideo = list_item.getVideoInfoTag()
         info_tag.setTitle(season.title)
-        info_tag.setDateAdded(season.created_at.strftime(KODI_DATETIME_FORMAT))
-        # FIXME: if we set a trailer on a folder, then clicking the folder tries (and fails) to play the trailer
-        if season.trailer_url is not None and False:  # noqa: SIM223
-            path = None
-            if isinstance(season.trailer_url, int):
-                path = router.url_for("play", id=season.trailer_url)
-            else:
-                path = router.url_for("play", slug=Path(season.trailer_url).name)
-            info_tag.setTrailer(path)
+        info_tag.setDateAdded(_kodi_datetime(season.created_at))
+        # FIXME: no trailer on folders, clicking the folder would try (and fail) to play it instead of opening it
         info_tag.setMediaType("season")
         info_tag.setSeason(season.season_number)
 
         contextmenu = []
         if season.is_in_list:
-            url = router.url_for("remove_from_list", entity_type="series", entity_id=season.entity_id)
+            command = router.url_template("remove_from_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="series", entity_id=season.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.REMOVE_FROM_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         else:
-            url = router.url_for("add_to_list", entity_type="series", entity_id=season.entity_id)
+            command = router.url_template("add_to_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="series", entity_id=season.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.ADD_TO_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         list_item.addContextMenuItems(
             contextmenu,
             replaceItems=True,
         )
-        xbmcplugin.addDirectoryItem(
-            self.__handle,
-            path,
-            list_item,
-            isFolder=True,
-            totalItems=self.__total_items or 0,
-        )
+        self.__items.append((path, list_item, True))
 
     def add_collection(
         self,
@@ -358,7 +346,7 @@ class Folder:
         router: Router,
         collection: Collection,
     ) -> None:
-        path = router.url_for("show_collection", collection_id=collection.entity_id)
+        path = router.url_template("show_collection", "collection_id")(collection_id=collection.entity_id)
 
         list_item = xbmcgui.ListItem(
             label=self.__add_prefix("COL", collection.name),
@@ -380,43 +368,50 @@ class Folder:
         if collection.short_description is not None:
             info_tag.setPlotOutline(collection.short_description)
         if collection.created_at is not None:
-            info_tag.setDateAdded(collection.created_at.strftime(KODI_DATETIME_FORMAT))
+            info_tag.setDateAdded(_kodi_datetime(collection.created_at))
         info_tag.setMediaType("tvshow")
 
         contextmenu = []
         if collection.is_in_list:
-            url = router.url_for("remove_from_list", entity_type="collection", entity_id=collection.entity_id)
+            command = router.url_template("remove_from_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="collection", entity_id=collection.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.REMOVE_FROM_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         else:
-            url = router.url_for("add_to_list", entity_type="collection", entity_id=collection.entity_id)
+            command = router.url_template("add_to_list", "entity_type", "entity_id", run_plugin=True)(
+                entity_type="collection", entity_id=collection.entity_id
+            )
             contextmenu.append(
                 (
                     _(_.ADD_TO_LIST),
-                    f"RunPlugin({url})",
+                    command,
                 )
             )
         list_item.addContextMenuItems(
             contextmenu,
             replaceItems=True,
         )
-        xbmcplugin.addDirectoryItem(
-            self.__handle,
-            path,
-            list_item,
-            isFolder=True,
-            totalItems=self.__total_items or 0,
-        )
+        self.__items.append((path, list_item, True))
+
+    def after_render(self, fn: Callable[[], None]) -> None:
+        self.__after_render = fn
 
     def render(self) -> None:
+        xbmcplugin.addDirectoryItems(self.__handle, self.__items, totalItems=len(self.__items))
         xbmcplugin.endOfDirectory(self.__handle, cacheToDisc=False)
+        # Kodi already displays the folder at this point
+        if self.__after_render is not None:
+            self.__after_render()
 
 
 class Dialog:
+    __slots__ = ("__message", "__on_ok", "__title")
+
     def __init__(self, *, title: int, message: int, on_ok: Callable[[], None]) -> None:
         self.__title = _(title)
         self.__message = _(message)
@@ -429,6 +424,8 @@ class Dialog:
 
 
 class TextDialog:
+    __slots__ = ("__on_ok", "__title")
+
     def __init__(self, *, title: int, on_ok: Callable[[str], None]) -> None:
         self.__title = _(title)
         self.__on_ok = on_ok
@@ -440,6 +437,17 @@ class TextDialog:
             self.__on_ok(res)
 
 
+# concrete medium type -> Folder method, looked up once per item
+_MEDIUM_ADDERS: dict[type, Callable[[Folder, Router, Any], None]] = {
+    UnreleasedVideo: lambda folder, router, medium: folder.add_video(router=router, video=medium),
+    ReleasedVideo: lambda folder, router, medium: folder.add_video(router=router, video=medium),
+    Movie: lambda folder, router, medium: folder.add_video(router=router, video=medium),
+    Collection: lambda folder, router, medium: folder.add_collection(router=router, collection=medium),
+    Series: lambda folder, router, medium: folder.add_series(router=router, series=medium),
+    Season: lambda folder, router, medium: folder.add_season(router=router, season=medium),
+}
+
+
 def render_page(  # noqa: PLR0913
     router: Router,
     *,
@@ -448,13 +456,13 @@ def render_page(  # noqa: PLR0913
     page: PaginatedMedia,
     content: str = "videos",
     extra: dict[str, Any] | None = None,
+    prefetch: Callable[..., None] | None = None,
 ) -> Folder:
     if extra is None:
         extra = {}
     folder = Folder(
         _(_.PAGE_TITLE).format(page=page.page, title=_(title) if isinstance(title, int) else title),
         content=content,
-        total_items=len(page.items),
     )
     if page.page > 1:
         kwargs = extra.copy()
@@ -470,16 +478,11 @@ def render_page(  # noqa: PLR0913
             special_sort="top",
         )
     for medium in page.items:
-        if isinstance(medium, (Video, Movie)):
-            folder.add_video(router=router, video=medium)
-        elif isinstance(medium, Collection):
-            folder.add_collection(router=router, collection=medium)
-        elif isinstance(medium, Series):
-            folder.add_series(router=router, series=medium)
-        elif isinstance(medium, Season):
-            folder.add_season(router=router, season=medium)
-        else:
+        add = _MEDIUM_ADDERS.get(type(medium))
+        if add is None:
             log_message(f"Unknown medium type: {type(medium)}", level=LOGWARNING)
+            continue
+        add(folder, router, medium)
     if page.next_page is not None:
         folder.add_folder(
             router=router,
@@ -491,6 +494,9 @@ def render_page(  # noqa: PLR0913
             ),
             special_sort="bottom",
         )
+        if prefetch is not None:
+            next_page = page.next_page
+            folder.after_render(lambda: prefetch(page=next_page))
     return folder
 
 
@@ -498,9 +504,13 @@ def refresh() -> None:
     xbmc.executebuiltin("Container.Refresh")
 
 
+def run_plugin(url: str) -> None:
+    xbmc.executebuiltin(f"RunPlugin({url})")
+
+
 def notify(message: int, *, time: int) -> None:
-    addon_name = Addon.XBMC.getAddonInfo("name")
-    addon_icon = Addon.XBMC.getAddonInfo("icon")
+    addon_name = Addon.xbmc().getAddonInfo("name")
+    addon_icon = Addon.xbmc().getAddonInfo("icon")
     xbmc.executebuiltin(f"Notification({addon_name}, {_(message)}, {time}, {addon_icon})")
 
 
@@ -1,6 +1,7 @@
 import os
 import sys
 import traceback
+from collections.abc import Callable
 
 import xbmc
 from xbmc import LOGDEBUG, LOGERROR, LOGINFO, LOGNONE, LOGWARNING
@@ -19,19 +20,21 @@ def _log(msg: str, level: int = LOGDEBUG) -> None:
         xbmc.log(msg, level=level)
 
 
-def log_message(message: str, *, level: int = LOGDEBUG) -> None:
+def log_message(message: str | Callable[[], str], *, level: int = LOGDEBUG) -> None:
     if level == LOGNONE:
         return
     if Addon.debug() and (level == LOGDEBUG):
         level = LOGINFO
+    if callable(message):
+        message = message()
     _log(f"{Addon.ID}: {message}", level=level)
 
 
 def log_exception(message: str) -> None:
-    exc_typ, exc, tb = sys.exc_info()
-    if exc_typ is None or exc is None or tb is None:
+    exc = sys.exception()
+    if exc is None:
         return
     _log(
-        f"{Addon.ID}: {message} {''.join(traceback.format_exception(exc_typ, exc, tb))}",
+        f"{Addon.ID}: {message} {''.join(traceback.TracebackException.from_exception(exc).format())}",
         level=LOGERROR,
     )
@@ -2,41 +2,61 @@
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def _generate_html_for_folder(folder: str, *, show_parent: bool = False) -> None:
-    index_page = "index.html"
+_INDEX_PAGE = "index.html"
+# same replacements as html.escape, in a single pass
+_HTML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _generate_html_for_tree(root: str) -> None:
+    # list the whole tree first, every index page then only depends on its own entries and can be written concurrently
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        futures = [
+            executor.submit(
+                _generate_html_for_folder,
+                folder,
+                folders,
+                files,
+                show_parent=folder != root,
+            )
+            for folder, folders, files in os.walk(root, followlinks=True)
+        ]
+    for future in futures:
+        future.result()
+
+
+def _generate_html_for_folder(
+    folder: str, folders: list[str], files: list[str], *, show_parent: bool
+) -> None:
     print(f"Generating HTML for {folder}")
+    files = [f for f in files if f != _INDEX_PAGE]
 
-    folders = []
-    files = []
-    for f in os.scandir(folder):
-        filename = Path(f.path).name
-        if f.is_dir():
-            _generate_html_for_folder(f.path, show_parent=True)
-            folders.append(filename)
-        elif filename != index_page:
-            files.append(filename)
-
-    folderp = Path(folder)
-    folder_name = folderp.name
-    with (folderp / index_page).open("w") as f:
-        f.write("<!DOCTYPE html>\n")
-        f.write('<html lang="en">\n')
-        f.write("<head>\n")
-        f.write(f"<title>{folder_name}</title>\n")
-        f.write("</head>\n")
-        f.write("<body>\n")
-        f.write(f"<h1>{folder_name}</h1>\n")
-        f.write("<ul>\n")
-        if show_parent:
-            f.write('<li><a href="..">..</a></li>\n')
-        f.writelines(f'<li><a href="{fld}/">{fld}/</a></li>\n' for fld in folders)
-        for filename in files:
-            f.write(f'<li><a href="{filename}">{filename}</a></li>\n')
-        f.write("</body>\n")
-        f.write("</html>\n")
+    folder_name = Path(folder).name.translate(_HTML_ESCAPES)
+    parts = [
+        "<!DOCTYPE html>\n",
+        '<html lang="en">\n',
+        "<head>\n",
+        f"<title>{folder_name}</title>\n",
+        "</head>\n",
+        "<body>\n",
+        f"<h1>{folder_name}</h1>\n",
+        "<ul>\n",
+    ]
+    if show_parent:
+        parts.append('<li><a href="..">..</a></li>\n')
+    for fld in folders:
+        fld_e = fld.translate(_HTML_ESCAPES)
+        parts.append(f'<li><a href="{fld_e}/">{fld_e}/</a></li>\n')
+    for filename in files:
+        filename_e = filename.translate(_HTML_ESCAPES)
+        parts.append(f'<li><a href="{filename_e}">{filename_e}</a></li>\n')
+    parts.append("</ul>\n</body>\n</html>\n")
+    (Path(folder) / _INDEX_PAGE).write_text("".join(parts))
 
 
 def _main() -> None:
@@ -47,7 +67,7 @@ def _main() -> None:
         help="The folder where to start listing files",
     )
     args = parser.parse_args()
-    _generate_html_for_folder(args.folder)
+    _generate_html_for_tree(args.folder)
 
 
 if __name__ == "__main__":